@@ -300,7 +300,118 @@ class DatabaseManager:
                 WHERE id = ?
             """, (total_entities, successful_entities, failed_entities, success_rate, document_db_id))
             conn.commit()
-    
+
+    def _lookup_ids(self, conn: sqlite3.Connection, table: str, key_column: str) -> Dict[str, int]:
+        """Map the key column of a reference table to its row IDs."""
+        return {row[0]: row[1] for row in conn.execute(f"SELECT {key_column}, id FROM {table}")}
+
+    def bulk_store_documents(self, doc_rows: List[Tuple], session_id: str = None,
+                             conn: sqlite3.Connection = None) -> List[int]:
+        """
+        Store many generated documents with a single executemany.
+
+        Each row is (document_id, country_code, document_type, corruption_level,
+        original_text, corrupted_text, template_used, generation_mode,
+        total_entities, successful_entities, failed_entities), so the entity
+        statistics are written with the document instead of a later update.
+
+        Args:
+            doc_rows: Document rows in the order above
+            session_id: Associated session ID
+            conn: Open connection to run in; the caller then owns the transaction
+                and the commit. A new connection is opened and committed if None.
+
+        Returns:
+            List[int]: Database IDs of the stored documents, in row order
+        """
+        if conn is None:
+            with self.get_connection() as own_conn:
+                doc_db_ids = self.bulk_store_documents(doc_rows, session_id, own_conn)
+                own_conn.commit()
+                return doc_db_ids
+
+        if not doc_rows:
+            return []
+
+        country_ids = self._lookup_ids(conn, 'countries', 'code')
+        doc_type_ids = self._lookup_ids(conn, 'document_types', 'name')
+        corruption_ids = self._lookup_ids(conn, 'corruption_levels', 'name')
+
+        def resolve(ids: Dict[str, int], key: str, kind: str) -> int:
+            try:
+                return ids[key]
+            except KeyError:
+                raise ValueError(f"Unknown {kind}: {key}") from None
+
+        rows = [
+            (document_id,
+             resolve(country_ids, country_code, 'country code'),
+             resolve(doc_type_ids, document_type, 'document type'),
+             resolve(corruption_ids, corruption_level, 'corruption level'),
+             original_text, corrupted_text, template_used, generation_mode,
+             total, successful, failed,
+             (successful / total * 100) if total > 0 else 0.0)
+            for (document_id, country_code, document_type, corruption_level,
+                 original_text, corrupted_text, template_used, generation_mode,
+                 total, successful, failed) in doc_rows
+        ]
+
+        conn.executemany("""
+            INSERT INTO generated_documents
+            (document_id, country_id, document_type_id, corruption_level_id,
+             original_text, corrupted_text, template_used, generation_mode,
+             total_entities, successful_entities, failed_entities, success_rate)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+
+        # The write lock is held for the whole statement and ids are
+        # AUTOINCREMENT, so the batch occupies a contiguous id range.
+        last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
+    def bulk_store_entities(self, entity_rows: List[Tuple],
+                            conn: sqlite3.Connection = None) -> int:
+        """
+        Store many document entities with a single executemany.
+
+        Each row is (document_db_id, entity_type, original_text, corrupted_text,
+        start_pos, end_pos, is_preserved, confidence).
+
+        Args:
+            entity_rows: Entity rows in the order above
+            conn: Open connection to run in; the caller then owns the transaction
+                and the commit. A new connection is opened and committed if None.
+
+        Returns:
+            int: Number of entities stored
+        """
+        if conn is None:
+            with self.get_connection() as own_conn:
+                stored = self.bulk_store_entities(entity_rows, own_conn)
+                own_conn.commit()
+                return stored
+
+        if not entity_rows:
+            return 0
+
+        entity_type_ids = self._lookup_ids(conn, 'entity_types', 'name')
+
+        def rows():
+            for row in entity_rows:
+                try:
+                    entity_type_id = entity_type_ids[row[1]]
+                except KeyError:
+                    raise ValueError(f"Unknown entity type: {row[1]}") from None
+                yield (row[0], entity_type_id) + tuple(row[2:])
+
+        conn.executemany("""
+            INSERT INTO document_entities
+            (document_id, entity_type_id, original_text, corrupted_text,
+             start_pos, end_pos, is_preserved, confidence)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows())
+        return len(entity_rows)
+
     # ==========================================
     # Query and Analysis Methods
     # ==========================================
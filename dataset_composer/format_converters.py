@@ -20,14 +20,98 @@ Date: October 2024
 Purpose: Enable dual-format export for comprehensive NER training
 """
 
+import bisect
+import functools
+import itertools
 import logging
+import mmap
+import operator
 import re
-from typing import Dict, List, Any, Tuple, Optional
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Tuple, Optional, Iterator
 from pathlib import Path
-import json
 
 logger = logging.getLogger(__name__)
 
+# Below this many documents the pool start-up cost outweighs the speedup
+PARALLEL_THRESHOLD = 512
+# Documents per task submitted to the process pool
+PARALLEL_CHUNK_SIZE = 64
+
+# Lines encoded and written per write call when saving CONLL files
+CONLL_WRITE_BATCH = 10000
+
+# DocBin payloads larger than this are written through a memory map
+MMAP_WRITE_THRESHOLD = 64 * 1024 * 1024
+
+# Token attributes serialized into DocBin files
+DOCBIN_ATTRS = ["ORTH", "TAG", "HEAD", "DEP", "ENT_IOB", "ENT_TYPE"]
+
+# Tag for tokens outside any entity
+OUTSIDE_TAG = sys.intern('O')
+
+# Characters that would break the token<TAB>tag layout of a CONLL line
+_TOKEN_TRANS = str.maketrans({'\t': ' ', '\n': ' ', '\r': ' '})
+_WS_RE = re.compile(r'\s+')
+# Matches any token that _clean_token would change: whitespace at either
+# end, runs of whitespace, or whitespace other than a plain space
+_BAD_CHARS_RE = re.compile(r'^\s|\s$|\s\s|[^\S ]')
+
+_start_key = operator.itemgetter('start')
+
+
+def _sort_entities_by_start(documents: List[Dict[str, Any]]) -> None:
+    """
+    Sort each document's entities by start offset, in place.
+    
+    Both converters call this once at ingest so per-document code can rely
+    on entities already being ordered.
+    
+    Args:
+        documents (List[Dict[str, Any]]): Documents whose entities are sorted
+    """
+    for doc_data in documents:
+        entities = doc_data.get('entities')
+        if entities:
+            try:
+                entities.sort(key=_start_key)
+            except KeyError:
+                entities.sort(key=lambda x: x.get('start', 0))
+
+
+def _entities_to_soa(entities: List[Dict[str, Any]]) -> Tuple[List[int], List[int], List[str]]:
+    """
+    Split entity dictionaries into parallel start, end and label lists.
+    
+    Args:
+        entities (List[Dict[str, Any]]): Entity annotations
+        
+    Returns:
+        Tuple[List[int], List[int], List[str]]: (starts, ends, labels)
+    """
+    starts = [entity.get('start', 0) for entity in entities]
+    ends = [entity.get('end', 0) for entity in entities]
+    labels = [entity.get('label', 'UNKNOWN') for entity in entities]
+    return starts, ends, labels
+
+
+@functools.lru_cache(maxsize=8)
+def _get_blank_nlp(language: str):
+    """
+    Return a blank spaCy pipeline for a language, shared across converters.
+    
+    The cached object is shared, so callers must not add or remove pipes.
+    
+    Args:
+        language (str): Language code for spaCy model
+        
+    Returns:
+        Language: Blank spaCy language object
+    """
+    import spacy
+    return spacy.blank(language)
+
 class SpacyFormatConverter:
     """
     Converts internal JSON format to spaCy DocBin (.spacy) binary format.
@@ -50,12 +134,19 @@ class SpacyFormatConverter:
     def _initialize_spacy(self):
         """Initialize spaCy language model."""
         try:
-            import spacy
-            from spacy.tokens import DocBin
+            from spacy.tokens import DocBin, Span
             
-            # Create blank language model
-            self.nlp = spacy.blank(self.language)
+            # Reuse the blank language model shared by all converters
+            self.nlp = _get_blank_nlp(self.language)
             self.DocBin = DocBin
+            self.Span = Span
+            
+            try:
+                from spacy.util import filter_spans
+                self._filter_spans = filter_spans
+            except ImportError:
+                # Older spaCy releases: fall back to the pure-Python resolver
+                self._filter_spans = self._resolve_overlapping_entities
             logger.info(f"Initialized spaCy converter for language: {self.language}")
             
         except ImportError:
@@ -78,7 +169,8 @@ class SpacyFormatConverter:
         if not self.nlp:
             raise RuntimeError("spaCy not properly initialized")
         
-        doc_bin = self.DocBin(attrs=["ORTH", "TAG", "HEAD", "DEP", "ENT_IOB", "ENT_TYPE"])
+        doc_bin = self.DocBin(attrs=DOCBIN_ATTRS)
+        _sort_entities_by_start(documents)
         
         for doc_data in documents:
             try:
@@ -92,12 +184,13 @@ class SpacyFormatConverter:
         logger.info(f"Converted {len(doc_bin)} documents to DocBin")
         return doc_bin
     
-    def _create_spacy_doc(self, doc_data: Dict[str, Any]) -> Optional['Doc']:
+    def _create_spacy_doc(self, doc_data: Dict[str, Any], doc: Optional['Doc'] = None) -> Optional['Doc']:
         """
         Create a spaCy Doc object from document data.
         
         Args:
             doc_data (Dict[str, Any]): Document data with text and entities
+            doc (Optional[Doc]): Already tokenized text, e.g. from nlp.pipe
             
         Returns:
             Optional[Doc]: spaCy Doc object or None if conversion fails
@@ -110,45 +203,48 @@ class SpacyFormatConverter:
             return None
         
         # Create Doc object
-        doc = self.nlp(text)
+        if doc is None:
+            doc = self.nlp(text)
+        
+        # Index token character offsets once so each entity maps to token
+        # indices by bisection instead of a char_span alignment scan
+        token_starts = [token.idx for token in doc]
+        token_ends = [token.idx + len(token) for token in doc]
         
         # Prepare entity spans
         entity_spans = []
-        for entity in entities:
+        text_length = len(text)
+        for entity, start, end, label in zip(entities, *_entities_to_soa(entities)):
             try:
-                start = entity.get('start', 0)
-                end = entity.get('end', 0)
-                label = entity.get('label', 'UNKNOWN')
-                
-                # Validate span boundaries
-                if start < 0 or end > len(text) or start >= end:
-                    logger.warning(f"Invalid entity span: {start}-{end} in text of length {len(text)}")
+                # Validate span boundaries before any alignment work
+                if start < 0 or end > text_length or start >= end:
+                    logger.warning(f"Invalid entity span: {start}-{end} in text of length {text_length}")
                     continue
                 
-                # Validate entity text matches
-                entity_text = text[start:end]
+                # Validate entity text matches without slicing the text
                 expected_text = entity.get('text', '')
-                if expected_text and entity_text != expected_text:
-                    logger.warning(f"Entity text mismatch: expected '{expected_text}', got '{entity_text}'")
+                if expected_text and not (len(expected_text) == end - start
+                                          and text.startswith(expected_text, start)):
+                    logger.warning(f"Entity text mismatch: expected '{expected_text}', got '{text[start:end]}'")
                 
-                # Find character span in Doc
-                char_span = doc.char_span(start, end, label=label, alignment_mode="expand")
+                # Tokens overlapping [start, end), same as alignment_mode="expand"
+                first_token = bisect.bisect_right(token_ends, start)
+                end_token = bisect.bisect_left(token_starts, end)
+                if first_token < end_token:
+                    char_span = self.Span(doc, first_token, end_token, label=label)
+                else:
+                    char_span = doc.char_span(start, end, label=label, alignment_mode="expand")
                 if char_span:
                     entity_spans.append(char_span)
                 else:
-                    logger.warning(f"Could not create span for entity: {start}-{end} '{entity_text}'")
+                    logger.warning(f"Could not create span for entity: {start}-{end} '{text[start:end]}'")
                     
             except Exception as e:
                 logger.warning(f"Error processing entity {entity}: {e}")
                 continue
         
-        # Set entities on Doc
-        try:
-            doc.ents = entity_spans
-        except ValueError as e:
-            logger.warning(f"Could not set entities on doc: {e}")
-            # Try to resolve overlapping entities
-            doc.ents = self._resolve_overlapping_entities(entity_spans)
+        # Set entities on Doc, keeping the longest of any overlapping spans
+        doc.ents = self._filter_spans(entity_spans)
         
         return doc
     
@@ -156,6 +252,8 @@ class SpacyFormatConverter:
         """
         Resolve overlapping entity spans by keeping the longest ones.
         
+        Only used when spacy.util.filter_spans is unavailable.
+        
         Args:
             spans (List[Span]): List of potentially overlapping spans
             
@@ -198,7 +296,18 @@ class SpacyFormatConverter:
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            doc_bin.to_disk(output_path)
+            data = doc_bin.to_bytes()
+            # Opened read/write because a shared mapping needs both
+            with open(output_path, 'w+b') as f:
+                if len(data) > MMAP_WRITE_THRESHOLD:
+                    # Copy straight into the page cache for large exports
+                    f.truncate(len(data))
+                    with mmap.mmap(f.fileno(), len(data)) as m:
+                        if hasattr(m, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                            m.madvise(mmap.MADV_SEQUENTIAL)
+                        m[:] = data
+                else:
+                    f.write(data)
             
             file_size = output_path.stat().st_size
             logger.info(f"Saved spaCy DocBin to {output_path} ({file_size:,} bytes)")
@@ -226,6 +335,53 @@ class SpacyFormatConverter:
             logger.error(f"Failed to convert and save documents: {e}")
             return False
 
+    
+    def convert_and_save_many(self, splits: Dict[str, List[Dict[str, Any]]],
+                              output_dir: str) -> Dict[str, str]:
+        """
+        Convert several dataset splits in one tokenizer pass and save each.
+        
+        All texts are tokenized in a single nlp.pipe stream and each Doc is
+        routed to its split's DocBin, written as '<split>.spacy'.
+        
+        Args:
+            splits (Dict[str, List[Dict[str, Any]]]): Documents keyed by split name
+            output_dir (str): Directory for the .spacy files
+            
+        Returns:
+            Dict[str, str]: Mapping of split name to saved file path
+        """
+        if not self.nlp:
+            raise RuntimeError("spaCy not properly initialized")
+        
+        doc_bins = {}
+        split_keys = []
+        all_documents = []
+        for key, documents in splits.items():
+            _sort_entities_by_start(documents)
+            doc_bins[key] = self.DocBin(attrs=DOCBIN_ATTRS)
+            split_keys.extend([key] * len(documents))
+            all_documents.extend(documents)
+        
+        all_texts = (doc_data.get('text', '') for doc_data in all_documents)
+        for key, doc_data, doc in zip(split_keys, all_documents, self.nlp.pipe(all_texts, batch_size=64)):
+            try:
+                doc = self._create_spacy_doc(doc_data, doc)
+                if doc:
+                    doc_bins[key].add(doc)
+            except Exception as e:
+                logger.warning(f"Failed to convert document {doc_data.get('document_id', 'unknown')}: {e}")
+                continue
+        
+        saved_files = {}
+        for key, doc_bin in doc_bins.items():
+            logger.info(f"Converted {len(doc_bin)} documents to DocBin for split '{key}'")
+            split_path = Path(output_dir) / f"{key}.spacy"
+            if self.save_docbin(doc_bin, str(split_path)):
+                saved_files[key] = str(split_path)
+        
+        return saved_files
+
 
 class TransformersFormatConverter:
     """
@@ -235,20 +391,32 @@ class TransformersFormatConverter:
     compatibility with transformer-based NER models.
     """
     
-    def __init__(self, tokenization_method: str = 'whitespace'):
+    # Token patterns for the supported tokenization methods
+    _WS_PAT = re.compile(r'\S+')
+    _SIMPLE_PAT = re.compile(r'(\w+|[^\w\s])')  # Words or single punctuation marks
+    
+    def __init__(self, tokenization_method: str = 'whitespace', max_workers: Optional[int] = None):
         """
         Initialize the transformers converter.
         
         Args:
             tokenization_method (str): Tokenization method ('whitespace', 'simple')
+            max_workers (Optional[int]): Worker processes for large batches
+                (default: number of CPUs)
         """
         self.tokenization_method = tokenization_method
+        self.max_workers = max_workers
+        # label -> (B- tag, I- tag), so each tag string is built once
+        self._bi_cache: Dict[str, Tuple[str, str]] = {}
         logger.info(f"Initialized Transformers converter with {tokenization_method} tokenization")
     
     def convert_documents_to_conll(self, documents: List[Dict[str, Any]]) -> List[str]:
         """
         Convert documents to CONLL format lines.
         
+        Batches larger than PARALLEL_THRESHOLD are converted in a process pool;
+        document order is preserved either way.
+        
         Args:
             documents (List[Dict[str, Any]]): Documents to convert
             
@@ -257,18 +425,78 @@ class TransformersFormatConverter:
         """
         conll_lines = []
         
-        for doc_data in documents:
-            try:
-                doc_lines = self._convert_single_document(doc_data)
-                conll_lines.extend(doc_lines)
-                conll_lines.append("")  # Blank line between documents
-            except Exception as e:
-                logger.warning(f"Failed to convert document {doc_data.get('document_id', 'unknown')}: {e}")
-                continue
+        for doc_lines in self._iter_converted_documents(documents):
+            conll_lines.extend(doc_lines)
+            conll_lines.append("")  # Blank line between documents
         
         logger.info(f"Converted {len(documents)} documents to CONLL format")
         return conll_lines
     
+    def _iter_converted_documents(self, documents: List[Dict[str, Any]],
+                                  executor: Optional[ProcessPoolExecutor] = None) -> Iterator[List[str]]:
+        """
+        Yield the CONLL lines of each document in input order.
+        
+        Documents that fail to convert are logged and skipped.
+        
+        Args:
+            documents (List[Dict[str, Any]]): Documents to convert
+            executor (Optional[ProcessPoolExecutor]): Pool to reuse for large batches
+            
+        Yields:
+            List[str]: CONLL format lines for one document
+        """
+        _sort_entities_by_start(documents)
+        
+        results = None
+        if len(documents) > PARALLEL_THRESHOLD and self.max_workers != 1:
+            try:
+                pool_results = self._convert_in_pool(documents, executor)
+                # Starts the pool and runs the first chunk, so a pool that
+                # cannot start fails here rather than mid-export
+                first_result = next(pool_results)
+            except (OSError, RuntimeError) as e:
+                logger.warning(f"Process pool unavailable, converting serially: {e}")
+            else:
+                results = itertools.chain([first_result], pool_results)
+        
+        if results is None:
+            results = (_convert_one(self, doc_data) for doc_data in documents)
+        
+        for doc_data, (doc_lines, error) in zip(documents, results):
+            if error is not None:
+                logger.warning(f"Failed to convert document {doc_data.get('document_id', 'unknown')}: {error}")
+                continue
+            yield doc_lines
+    
+    def _convert_in_pool(self, documents: List[Dict[str, Any]],
+                         executor: Optional[ProcessPoolExecutor] = None) -> Iterator[Tuple[Optional[List[str]], Optional[str]]]:
+        """
+        Convert documents in chunks across a process pool.
+        
+        Results are yielded chunk by chunk so callers can stream them.
+        
+        Args:
+            documents (List[Dict[str, Any]]): Documents to convert
+            executor (Optional[ProcessPoolExecutor]): Pool to reuse; a new one
+                is started and shut down when omitted
+            
+        Yields:
+            Tuple[Optional[List[str]], Optional[str]]: (lines, error) per document
+        """
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                yield from self._convert_in_pool(documents, executor)
+            return
+        
+        chunks = [documents[i:i + PARALLEL_CHUNK_SIZE]
+                  for i in range(0, len(documents), PARALLEL_CHUNK_SIZE)]
+        chunk_results = executor.map(_convert_chunk, chunks,
+                                     [self.tokenization_method] * len(chunks),
+                                     chunksize=1)
+        for chunk_result in chunk_results:
+            yield from chunk_result
+    
     def _convert_single_document(self, doc_data: Dict[str, Any]) -> List[str]:
         """
         Convert a single document to CONLL format.
@@ -291,14 +519,9 @@ class TransformersFormatConverter:
         # Create BIO tags
         bio_tags = self._create_bio_tags(tokens, entities, text)
         
-        # Create CONLL lines
-        conll_lines = []
-        for token, tag in zip(tokens, bio_tags):
-            # Clean token for CONLL format
-            clean_token = self._clean_token(token['text'])
-            conll_lines.append(f"{clean_token}\t{tag}")
-        
-        return conll_lines
+        # Create CONLL lines, cleaning tokens for CONLL format
+        clean_token = self._clean_token
+        return [f"{clean_token(token['text'])}\t{tag}" for token, tag in zip(tokens, bio_tags)]
     
     def _tokenize_text(self, text: str) -> List[Dict[str, Any]]:
         """
@@ -320,9 +543,8 @@ class TransformersFormatConverter:
     def _whitespace_tokenize(self, text: str) -> List[Dict[str, Any]]:
         """Simple whitespace tokenization."""
         tokens = []
-        current_pos = 0
         
-        for match in re.finditer(r'\S+', text):
+        for match in self._WS_PAT.finditer(text):
             token_text = match.group()
             start_pos = match.start()
             end_pos = match.end()
@@ -338,12 +560,9 @@ class TransformersFormatConverter:
     def _simple_tokenize(self, text: str) -> List[Dict[str, Any]]:
         """Simple tokenization that splits on whitespace and punctuation."""
         tokens = []
-        current_pos = 0
         
         # Split on whitespace and common punctuation
-        pattern = r'(\w+|[^\w\s])'
-        
-        for match in re.finditer(pattern, text):
+        for match in self._SIMPLE_PAT.finditer(text):
             token_text = match.group()
             start_pos = match.start()
             end_pos = match.end()
@@ -363,44 +582,43 @@ class TransformersFormatConverter:
         
         Args:
             tokens (List[Dict[str, Any]]): Tokenized text
-            entities (List[Dict[str, Any]]): Entity annotations
+            entities (List[Dict[str, Any]]): Entity annotations, sorted by start
             original_text (str): Original text for validation
             
         Returns:
             List[str]: BIO tags for each token
         """
         # Initialize all tags as 'O' (Outside)
-        bio_tags = ['O'] * len(tokens)
+        bio_tags = [OUTSIDE_TAG] * len(tokens)
+        bi_cache = self._bi_cache
         
-        # Sort entities by start position
-        sorted_entities = sorted(entities, key=lambda x: x.get('start', 0))
+        # Token offsets are increasing, so overlapping tokens form a
+        # contiguous run found by bisection
+        token_starts = [token['start'] for token in tokens]
+        token_ends = [token['end'] for token in tokens]
         
-        for entity in sorted_entities:
-            entity_start = entity.get('start', 0)
-            entity_end = entity.get('end', 0)
-            entity_label = entity.get('label', 'UNKNOWN')
-            
+        # Entities were sorted by start position at ingest
+        for entity_start, entity_end, entity_label in zip(*_entities_to_soa(entities)):
             if entity_start >= entity_end:
                 continue
             
             # Find tokens that overlap with this entity
-            overlapping_tokens = []
-            for i, token in enumerate(tokens):
-                token_start = token['start']
-                token_end = token['end']
-                
-                # Check if token overlaps with entity
-                if (token_start < entity_end and token_end > entity_start):
-                    overlapping_tokens.append(i)
+            first_token = bisect.bisect_right(token_ends, entity_start)
+            end_token = bisect.bisect_left(token_starts, entity_end)
             
             # Apply BIO tagging
-            if overlapping_tokens:
+            if first_token < end_token:
+                tags = bi_cache.get(entity_label)
+                if tags is None:
+                    tags = bi_cache[entity_label] = (f"B-{entity_label}", f"I-{entity_label}")
+                begin_tag, inside_tag = tags
+                
                 # First token gets B- (Beginning)
-                bio_tags[overlapping_tokens[0]] = f"B-{entity_label}"
+                bio_tags[first_token] = begin_tag
                 
                 # Subsequent tokens get I- (Inside)
-                for token_idx in overlapping_tokens[1:]:
-                    bio_tags[token_idx] = f"I-{entity_label}"
+                for token_idx in range(first_token + 1, end_token):
+                    bio_tags[token_idx] = inside_tag
         
         return bio_tags
     
@@ -414,17 +632,21 @@ class TransformersFormatConverter:
         Returns:
             str: Cleaned token
         """
+        # Most tokens need no cleaning; one regex scan detects that
+        if _BAD_CHARS_RE.search(token) is None:
+            return token or '[EMPTY]'
+        
         # Replace tabs and newlines to avoid CONLL format issues
-        cleaned = token.replace('\t', ' ').replace('\n', ' ').replace('\r', ' ')
+        cleaned = token.translate(_TOKEN_TRANS)
         
-        # Remove extra whitespace
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        # Collapse extra whitespace; any whitespace other than a single space
+        # is non-printable, so the regex only runs when there is work to do
+        if '  ' in cleaned or not cleaned.isprintable():
+            cleaned = _WS_RE.sub(' ', cleaned)
+        cleaned = cleaned.strip()
         
         # If token becomes empty, use placeholder
-        if not cleaned:
-            cleaned = '[EMPTY]'
-        
-        return cleaned
+        return cleaned or '[EMPTY]'
     
     def save_conll(self, conll_lines: List[str], output_path: str) -> bool:
         """
@@ -441,9 +663,11 @@ class TransformersFormatConverter:
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                for line in conll_lines:
-                    f.write(line + '\n')
+            # Binary mode: encode one block per write instead of per line
+            with open(output_path, 'wb') as f:
+                for i in range(0, len(conll_lines), CONLL_WRITE_BATCH):
+                    batch = conll_lines[i:i + CONLL_WRITE_BATCH]
+                    f.write('\n'.join(batch).encode('utf-8') + b'\n')
             
             file_size = output_path.stat().st_size
             logger.info(f"Saved CONLL format to {output_path} ({file_size:,} bytes, {len(conll_lines)} lines)")
@@ -464,9 +688,76 @@ class TransformersFormatConverter:
         Returns:
             bool: True if successful, False otherwise
         """
+        return self.convert_and_save_streaming(documents, output_path)
+    
+    def convert_and_save_many(self, splits: Dict[str, List[Dict[str, Any]]],
+                              output_dir: str) -> Dict[str, str]:
+        """
+        Convert several dataset splits and save each as '<split>.conll'.
+        
+        Large splits share one process pool instead of starting a new one
+        per split.
+        
+        Args:
+            splits (Dict[str, List[Dict[str, Any]]]): Documents keyed by split name
+            output_dir (str): Directory for the .conll files
+            
+        Returns:
+            Dict[str, str]: Mapping of split name to saved file path
+        """
+        saved_files = {}
+        executor = None
+        if self.max_workers != 1 and any(len(docs) > PARALLEL_THRESHOLD for docs in splits.values()):
+            try:
+                executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            except (OSError, RuntimeError, NotImplementedError) as e:
+                # Each split then tries its own pool and falls back to serial
+                logger.warning(f"Process pool unavailable: {e}")
+        
         try:
-            conll_lines = self.convert_documents_to_conll(documents)
-            return self.save_conll(conll_lines, output_path)
+            for key, documents in splits.items():
+                split_path = Path(output_dir) / f"{key}.conll"
+                if self.convert_and_save_streaming(documents, str(split_path), executor):
+                    saved_files[key] = str(split_path)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        return saved_files
+    
+    def convert_and_save_streaming(self, documents: List[Dict[str, Any]], output_path: str,
+                                   executor: Optional[ProcessPoolExecutor] = None) -> bool:
+        """
+        Convert documents and write each one to file as soon as it is ready.
+        
+        Only one document's lines are held in memory at a time; the output is
+        identical to convert_documents_to_conll followed by save_conll.
+        
+        Args:
+            documents (List[Dict[str, Any]]): Documents to convert
+            output_path (str): Output file path
+            executor (Optional[ProcessPoolExecutor]): Pool to reuse for large batches
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            num_documents = 0
+            # Binary mode: encode each document block once
+            with open(output_path, 'wb') as f:
+                for doc_lines in self._iter_converted_documents(documents, executor):
+                    # Trailing empty entry adds the blank line between documents
+                    doc_lines.append('')
+                    f.write('\n'.join(doc_lines).encode('utf-8') + b'\n')
+                    num_documents += 1
+            
+            file_size = output_path.stat().st_size
+            logger.info(f"Saved CONLL format to {output_path} ({file_size:,} bytes, {num_documents} documents)")
+            return True
+            
         except Exception as e:
             logger.error(f"Failed to convert and save documents: {e}")
             return False
@@ -484,8 +775,11 @@ class TransformersFormatConverter:
         errors = []
         current_entity = None
         
-        for i, line in enumerate(conll_lines):
-            line = line.strip()
+        for i, line in enumerate(conll_lines, 1):
+            # Written lines carry no surrounding whitespace, so only strip
+            # lines that need it (e.g. lines read back with their newline)
+            if line[:1].isspace() or line[-1:].isspace():
+                line = line.strip()
             
             # Skip empty lines (document separators)
             if not line:
@@ -495,27 +789,67 @@ class TransformersFormatConverter:
             # Parse line
             parts = line.split('\t')
             if len(parts) != 2:
-                errors.append(f"Line {i+1}: Invalid format, expected 2 columns, got {len(parts)}")
+                errors.append(f"Line {i}: Invalid format, expected 2 columns, got {len(parts)}")
                 continue
             
             token, tag = parts
             
-            # Validate BIO tagging consistency
-            if tag.startswith('B-'):
+            # Validate BIO tagging consistency; 'O' dominates real corpora
+            if tag == 'O':
+                current_entity = None
+                continue
+            
+            # One-character slices are cached by CPython, so these compares
+            # allocate nothing
+            c0 = tag[:1]
+            is_prefixed = tag[1:2] == '-'
+            if c0 == 'B' and is_prefixed:
                 current_entity = tag[2:]  # Remove 'B-' prefix
-            elif tag.startswith('I-'):
+            elif c0 == 'I' and is_prefixed:
                 entity_type = tag[2:]  # Remove 'I-' prefix
                 if current_entity != entity_type:
-                    errors.append(f"Line {i+1}: I-{entity_type} without preceding B-{entity_type}")
-            elif tag == 'O':
-                current_entity = None
+                    errors.append(f"Line {i}: I-{entity_type} without preceding B-{entity_type}")
             else:
-                errors.append(f"Line {i+1}: Invalid tag format: {tag}")
+                errors.append(f"Line {i}: Invalid tag format: {tag}")
         
         is_valid = len(errors) == 0
         return is_valid, errors
 
 
+def _convert_one(converter: TransformersFormatConverter,
+                 doc_data: Dict[str, Any]) -> Tuple[Optional[List[str]], Optional[str]]:
+    """Convert one document, returning (lines, None) or (None, error message)."""
+    try:
+        return converter._convert_single_document(doc_data), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _convert_chunk(doc_data_list: List[Dict[str, Any]],
+                   tokenization_method: str) -> List[Tuple[Optional[List[str]], Optional[str]]]:
+    """
+    Convert a chunk of documents inside a worker process.
+    
+    Args:
+        doc_data_list (List[Dict[str, Any]]): Documents in this chunk
+        tokenization_method (str): Tokenization method for the worker's converter
+        
+    Returns:
+        List[Tuple[Optional[List[str]], Optional[str]]]: (lines, error) per document
+    """
+    converter = TransformersFormatConverter(tokenization_method=tokenization_method, max_workers=1)
+    return [_convert_one(converter, doc_data) for doc_data in doc_data_list]
+
+
+# Converter class for each supported format name (lowercase)
+_CONVERTERS = {
+    'spacy': SpacyFormatConverter,
+    'transformers': TransformersFormatConverter,
+    'conll': TransformersFormatConverter,
+    'bio': TransformersFormatConverter,
+}
+
+
 def get_converter(format_type: str, **kwargs) -> Optional[object]:
     """
     Factory function to get appropriate converter.
@@ -527,11 +861,9 @@ def get_converter(format_type: str, **kwargs) -> Optional[object]:
     Returns:
         Optional[object]: Converter instance or None if format not supported
     """
-    if format_type.lower() == 'spacy':
-        return SpacyFormatConverter(**kwargs)
-    elif format_type.lower() in ['transformers', 'conll', 'bio']:
-        return TransformersFormatConverter(**kwargs)
-    else:
+    converter_class = _CONVERTERS.get(format_type) or _CONVERTERS.get(format_type.lower())
+    if converter_class is None:
         logger.error(f"Unsupported format type: {format_type}")
         return None
+    return converter_class(**kwargs)
 
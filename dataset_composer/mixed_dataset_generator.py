@@ -27,23 +27,77 @@ Date: October 2024
 Purpose: Generate balanced datasets for robust NER model training
 """
 
+import copy
+import csv
+import hashlib
 import random
 import json
+import sys
 import numpy as np
 from typing import Dict, List, Any, Tuple, Optional
-from dataclasses import dataclass, asdict
-from collections import defaultdict, Counter
+from dataclasses import dataclass, field, fields
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
+from types import MappingProxyType
 import logging
 
-# Import format converters
-from .format_converters import SpacyFormatConverter, TransformersFormatConverter
+# Optional fast JSON serializer for dataset export
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Below this many PII documents the pool start-up cost outweighs the speedup
+# (the pool is opt-in, see MixedDatasetGenerator's max_workers)
+PARALLEL_THRESHOLD = 10000
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str,
+                            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def _distribution_arrays(distribution: Dict[str, float]) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """Return a distribution's keys and its read-only probability vector (sums to 1)."""
+    keys = tuple(distribution)
+    p = np.fromiter(distribution.values(), dtype=np.float64, count=len(keys))
+    total = p.sum()
+    if total > 0:
+        p /= total
+    p.setflags(write=False)
+    return keys, p
+
+
+def _check_distribution(name: str, distribution: Dict[str, float]) -> List[str]:
+    """Return validation errors for a distribution that must sum to 1.0."""
+    weights = np.fromiter(distribution.values(), dtype=np.float64, count=len(distribution))
+    errors = []
+    if not np.isclose(weights.sum(), 1.0, rtol=0.0, atol=1e-3):
+        errors.append(f"{name} must sum to 1.0")
+    if (weights < 0).any():
+        errors.append(f"{name} cannot have negative weights")
+    return errors
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class DatasetComposition:
-    """Configuration for dataset composition."""
+    """
+    Configuration for dataset composition.
+    
+    Keys and normalized probability vectors of the sampling distributions are
+    cached at construction; build a new composition instead of mutating the
+    distribution dicts in place.
+    """
     pii_ratio: float = 0.7  # Percentage of documents with PII
     negative_ratio: float = 0.3  # Percentage of documents without PII
     
@@ -59,6 +113,14 @@ class DatasetComposition:
     # Document type distribution for negative examples
     negative_doc_types: Dict[str, float] = None
     
+    # Sampling vectors cached by __post_init__
+    _country_keys: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _country_p: np.ndarray = field(default=None, init=False, repr=False, compare=False)
+    _corruption_keys: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _corruption_p: np.ndarray = field(default=None, init=False, repr=False, compare=False)
+    _negative_type_keys: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _negative_type_p: np.ndarray = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         if self.corruption_distribution is None:
             self.corruption_distribution = {
@@ -95,6 +157,76 @@ class DatasetComposition:
                 'form': 0.25,
                 'legal': 0.2
             }
+        
+        # Cached sampling vectors
+        self._country_keys, self._country_p = _distribution_arrays(self.country_distribution)
+        self._corruption_keys, self._corruption_p = _distribution_arrays(self.corruption_distribution)
+        self._negative_type_keys, self._negative_type_p = _distribution_arrays(self.negative_doc_types)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the configuration fields as a plain dict, without the cached vectors."""
+        return {f.name: copy.deepcopy(getattr(self, f.name)) for f in fields(self) if f.init}
+
+
+# Predefined composition templates, built once at import and shared read-only
+_COMPOSITION_TEMPLATES = MappingProxyType({
+    'balanced': DatasetComposition(
+        pii_ratio=0.7,
+        negative_ratio=0.3,
+        corruption_distribution={
+            'none': 0.15,
+            'light': 0.35,
+            'medium': 0.25,
+            'heavy': 0.15,
+            'extreme': 0.1
+        }
+    ),
+    'robustness_focused': DatasetComposition(
+        pii_ratio=0.6,
+        negative_ratio=0.4,
+        corruption_distribution={
+            'none': 0.1,
+            'light': 0.2,
+            'medium': 0.3,
+            'heavy': 0.25,
+            'extreme': 0.15
+        }
+    ),
+    'high_precision': DatasetComposition(
+        pii_ratio=0.8,
+        negative_ratio=0.2,
+        corruption_distribution={
+            'none': 0.3,
+            'light': 0.4,
+            'medium': 0.2,
+            'heavy': 0.1,
+            'extreme': 0.0
+        }
+    ),
+    'extreme_robustness': DatasetComposition(
+        pii_ratio=0.5,
+        negative_ratio=0.5,
+        corruption_distribution={
+            'none': 0.05,
+            'light': 0.15,
+            'medium': 0.25,
+            'heavy': 0.3,
+            'extreme': 0.25
+        }
+    ),
+    'production_ready': DatasetComposition(
+        pii_ratio=0.75,
+        negative_ratio=0.25,
+        corruption_distribution={
+            'none': 0.2,
+            'light': 0.4,
+            'medium': 0.25,
+            'heavy': 0.1,
+            'extreme': 0.05
+        }
+    )
+})
+
 
 class MixedDatasetGenerator:
     """
@@ -105,7 +237,8 @@ class MixedDatasetGenerator:
     """
     
     def __init__(self, pii_generator=None, negative_generator=None, 
-                 corruption_generator=None, database_manager=None):
+                 corruption_generator=None, database_manager=None,
+                 seed: Optional[int] = None, max_workers: Optional[int] = 1):
         """
         Initialize the mixed dataset generator.
         
@@ -114,74 +247,27 @@ class MixedDatasetGenerator:
             negative_generator: Negative examples generator instance
             corruption_generator: Extreme corruption generator instance
             database_manager: Database manager for storage
+            seed (Optional[int]): Seed for the sampling random generator; combined
+                with the session ID when one is given
+            max_workers (Optional[int]): Worker processes for large PII batches
+                (None: number of CPUs; default 1 generates in this process).
+                Only worth enabling with a real pii_generator: placeholder
+                documents are too cheap for the pool to pay off
         """
         self.pii_generator = pii_generator
         self.negative_generator = negative_generator
         self.corruption_generator = corruption_generator
         self.database_manager = database_manager
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.max_workers = max_workers
         
         # Predefined composition templates
         self.composition_templates = self._load_composition_templates()
     
     def _load_composition_templates(self) -> Dict[str, DatasetComposition]:
         """Load predefined dataset composition templates."""
-        return {
-            'balanced': DatasetComposition(
-                pii_ratio=0.7,
-                negative_ratio=0.3,
-                corruption_distribution={
-                    'none': 0.15,
-                    'light': 0.35,
-                    'medium': 0.25,
-                    'heavy': 0.15,
-                    'extreme': 0.1
-                }
-            ),
-            'robustness_focused': DatasetComposition(
-                pii_ratio=0.6,
-                negative_ratio=0.4,
-                corruption_distribution={
-                    'none': 0.1,
-                    'light': 0.2,
-                    'medium': 0.3,
-                    'heavy': 0.25,
-                    'extreme': 0.15
-                }
-            ),
-            'high_precision': DatasetComposition(
-                pii_ratio=0.8,
-                negative_ratio=0.2,
-                corruption_distribution={
-                    'none': 0.3,
-                    'light': 0.4,
-                    'medium': 0.2,
-                    'heavy': 0.1,
-                    'extreme': 0.0
-                }
-            ),
-            'extreme_robustness': DatasetComposition(
-                pii_ratio=0.5,
-                negative_ratio=0.5,
-                corruption_distribution={
-                    'none': 0.05,
-                    'light': 0.15,
-                    'medium': 0.25,
-                    'heavy': 0.3,
-                    'extreme': 0.25
-                }
-            ),
-            'production_ready': DatasetComposition(
-                pii_ratio=0.75,
-                negative_ratio=0.25,
-                corruption_distribution={
-                    'none': 0.2,
-                    'light': 0.4,
-                    'medium': 0.25,
-                    'heavy': 0.1,
-                    'extreme': 0.05
-                }
-            )
-        }
+        return dict(_COMPOSITION_TEMPLATES)
     
     def generate_mixed_dataset(self, total_size: int, composition: DatasetComposition,
                              train_ratio: float = 0.8, session_id: str = None) -> Dict[str, Any]:
@@ -199,19 +285,26 @@ class MixedDatasetGenerator:
         """
         logger.info(f"Generating mixed dataset of {total_size} documents")
         
+        # Independent random streams for this session
+        rng_pii, rng_negative, rng_shuffle = self._session_rngs(session_id)
+        
         # Calculate document counts
-        pii_count = int(total_size * composition.pii_ratio)
-        negative_count = total_size - pii_count
+        counts = self._distribute_counts(
+            total_size, {'pii': composition.pii_ratio, 'negative': composition.negative_ratio}
+        )
+        pii_count = counts['pii']
+        negative_count = counts['negative']
         
         # Generate PII documents
-        pii_documents = self._generate_pii_documents(pii_count, composition)
+        pii_documents = self._generate_pii_documents(pii_count, composition, rng_pii)
         
         # Generate negative examples
-        negative_documents = self._generate_negative_documents(negative_count, composition)
+        negative_documents = self._generate_negative_documents(negative_count, composition, rng_negative)
         
-        # Combine and shuffle
+        # Combine and shuffle with a single permutation draw
         all_documents = pii_documents + negative_documents
-        random.shuffle(all_documents)
+        order = rng_shuffle.permutation(len(all_documents)).tolist()
+        all_documents = [all_documents[i] for i in order]
         
         # Split into train/dev
         train_size = int(len(all_documents) * train_ratio)
@@ -228,7 +321,7 @@ class MixedDatasetGenerator:
         dataset = {
             'train_documents': train_documents,
             'dev_documents': dev_documents,
-            'composition': asdict(composition),
+            'composition': composition.to_dict(),
             'statistics': stats,
             'metadata': {
                 'total_size': total_size,
@@ -236,105 +329,99 @@ class MixedDatasetGenerator:
                 'dev_size': len(dev_documents),
                 'pii_count': pii_count,
                 'negative_count': negative_count,
-                'generation_timestamp': np.datetime64('now').isoformat()
+                'generation_timestamp': str(np.datetime64('now'))
             }
         }
         
         logger.info(f"Generated mixed dataset: {len(train_documents)} train, {len(dev_documents)} dev")
         return dataset
     
-    def _generate_pii_documents(self, count: int, composition: DatasetComposition) -> List[Dict[str, Any]]:
-        """Generate PII documents according to composition."""
-        documents = []
+    def _session_rngs(self, session_id: Optional[str]) -> List[np.random.Generator]:
+        """
+        Create the PII, negative and shuffle random streams for a session.
         
-        # Distribute across countries
-        country_counts = self._distribute_counts(count, composition.country_distribution)
+        With a session ID the streams are seeded from an MD5 hash of it (plus
+        the generator seed, if set), so a session is reproducible and never
+        shares state with another session. Without one, the generator's own
+        random stream is used for all three.
         
-        # Distribute across corruption levels
-        corruption_counts = self._distribute_counts(count, composition.corruption_distribution)
+        Args:
+            session_id (Optional[str]): Session ID for tracking
+            
+        Returns:
+            List[np.random.Generator]: [pii_rng, negative_rng, shuffle_rng]
+        """
+        if session_id is None:
+            return [self.rng] * 3
         
-        for country, country_count in country_counts.items():
-            for corruption_level, corruption_count in corruption_counts.items():
-                # Calculate documents for this country-corruption combination
-                docs_to_generate = int((country_count / count) * (corruption_count / count) * count)
-                
-                if docs_to_generate == 0:
-                    continue
-                
-                # Generate documents using PII generator
-                if self.pii_generator:
-                    country_docs = self._generate_pii_batch(
-                        docs_to_generate, country, corruption_level, composition
-                    )
+        session_seed = int.from_bytes(hashlib.md5(str(session_id).encode()).digest()[:8], 'big')
+        entropy = session_seed if self.seed is None else [session_seed, self.seed]
+        return [np.random.default_rng(child) for child in np.random.SeedSequence(entropy).spawn(3)]
+    
+    def _generate_pii_documents(self, count: int, composition: DatasetComposition,
+                                rng: Optional[np.random.Generator] = None) -> List[Dict[str, Any]]:
+        """Generate PII documents according to composition."""
+        documents = []
+        
+        # Distribute across country-corruption combinations
+        cells = self._joint_cell_counts(
+            count,
+            composition._country_keys, composition._country_p,
+            composition._corruption_keys, composition._corruption_p,
+            rng
+        )
+        
+        if count > PARALLEL_THRESHOLD and self.max_workers != 1:
+            # One job per cell, each with its own seed drawn from the session stream
+            rng = rng if rng is not None else self.rng
+            seeds = rng.integers(0, 2**63, size=len(cells)).tolist()
+            jobs = [(self.pii_generator, docs_to_generate, country, corruption_level, composition, seed)
+                    for (country, corruption_level, docs_to_generate), seed in zip(cells, seeds)]
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                for country_docs in executor.map(_worker_generate_pii, jobs):
                     documents.extend(country_docs)
+            return documents
         
-        # Ensure we have the exact count
-        while len(documents) < count:
-            # Generate additional documents
-            country = random.choices(
-                list(composition.country_distribution.keys()),
-                weights=list(composition.country_distribution.values())
-            )[0]
-            corruption = random.choices(
-                list(composition.corruption_distribution.keys()),
-                weights=list(composition.corruption_distribution.values())
-            )[0]
-            
-            doc = self._generate_single_pii_document(country, corruption, composition)
-            documents.append(doc)
+        for country, corruption_level, docs_to_generate in cells:
+            country_docs = self._generate_pii_batch(
+                docs_to_generate, country, corruption_level, composition
+            )
+            documents.extend(country_docs)
         
-        return documents[:count]
+        return documents
     
-    def _generate_negative_documents(self, count: int, composition: DatasetComposition) -> List[Dict[str, Any]]:
+    def _generate_negative_documents(self, count: int, composition: DatasetComposition,
+                                     rng: Optional[np.random.Generator] = None) -> List[Dict[str, Any]]:
         """Generate negative example documents."""
         documents = []
         
-        # Distribute across document types
-        type_counts = self._distribute_counts(count, composition.negative_doc_types)
-        
-        # Distribute across corruption levels
-        corruption_counts = self._distribute_counts(count, composition.corruption_distribution)
-        
-        for doc_type, type_count in type_counts.items():
-            for corruption_level, corruption_count in corruption_counts.items():
-                docs_to_generate = int((type_count / count) * (corruption_count / count) * count)
-                
-                if docs_to_generate == 0:
-                    continue
-                
-                # Generate negative documents
-                if self.negative_generator:
-                    negative_docs = self._generate_negative_batch(
-                        docs_to_generate, doc_type, corruption_level
-                    )
-                    documents.extend(negative_docs)
-        
-        # Ensure we have the exact count
-        while len(documents) < count:
-            doc_type = random.choices(
-                list(composition.negative_doc_types.keys()),
-                weights=list(composition.negative_doc_types.values())
-            )[0]
-            corruption = random.choices(
-                list(composition.corruption_distribution.keys()),
-                weights=list(composition.corruption_distribution.values())
-            )[0]
-            
-            doc = self._generate_single_negative_document(doc_type, corruption)
-            documents.append(doc)
+        # Distribute across document type-corruption combinations
+        cells = self._joint_cell_counts(
+            count,
+            composition._negative_type_keys, composition._negative_type_p,
+            composition._corruption_keys, composition._corruption_p,
+            rng
+        )
+        
+        for doc_type, corruption_level, docs_to_generate in cells:
+            negative_docs = self._generate_negative_batch(
+                docs_to_generate, doc_type, corruption_level
+            )
+            documents.extend(negative_docs)
         
-        return documents[:count]
+        return documents
     
     def _generate_pii_batch(self, count: int, country: str, corruption_level: str,
                            composition: DatasetComposition) -> List[Dict[str, Any]]:
         """Generate a batch of PII documents for specific country and corruption level."""
-        documents = []
-        
-        for _ in range(count):
-            doc = self._generate_single_pii_document(country, corruption_level, composition)
-            documents.append(doc)
-        
-        return documents
+        # Placeholder documents in a batch are identical, so build one and
+        # shallow-copy it, giving each copy its own mutable containers
+        # (including the metadata's entity_types list)
+        template = self._generate_single_pii_document(country, corruption_level, composition)
+        metadata = template['metadata']
+        entity_types = metadata['entity_types']
+        return [dict(template, entities=[], metadata=dict(metadata, entity_types=list(entity_types)))
+                for _ in range(count)]
     
     def _generate_single_pii_document(self, country: str, corruption_level: str,
                                     composition: DatasetComposition) -> Dict[str, Any]:
@@ -360,13 +447,14 @@ class MixedDatasetGenerator:
     def _generate_negative_batch(self, count: int, doc_type: str, 
                                corruption_level: str) -> List[Dict[str, Any]]:
         """Generate a batch of negative example documents."""
-        documents = []
-        
-        for _ in range(count):
-            doc = self._generate_single_negative_document(doc_type, corruption_level)
-            documents.append(doc)
-        
-        return documents
+        if not self.negative_generator:
+            # Fallback documents in a batch are identical; copy one template
+            template = self._generate_single_negative_document(doc_type, corruption_level)
+            metadata = template['metadata']
+            return [dict(template, entities=[], metadata=dict(metadata)) for _ in range(count)]
+        
+        return [self._generate_single_negative_document(doc_type, corruption_level)
+                for _ in range(count)]
     
     def _generate_single_negative_document(self, doc_type: str, 
                                          corruption_level: str) -> Dict[str, Any]:
@@ -404,58 +492,99 @@ class MixedDatasetGenerator:
             }
         }
     
-    def _distribute_counts(self, total: int, distribution: Dict[str, float]) -> Dict[str, int]:
-        """Distribute total count according to distribution weights."""
-        counts = {}
-        remaining = total
-        
-        # Sort by value to handle rounding better
-        sorted_items = sorted(distribution.items(), key=lambda x: x[1], reverse=True)
+    def _joint_cell_counts(self, count: int,
+                           first_keys: Tuple[str, ...], first_p: np.ndarray,
+                           second_keys: Tuple[str, ...], second_p: np.ndarray,
+                           rng: Optional[np.random.Generator] = None) -> List[Tuple[str, str, int]]:
+        """
+        Split a count over combinations of two independent distributions.
         
-        for key, ratio in sorted_items[:-1]:
-            count = int(total * ratio)
-            counts[key] = count
-            remaining -= count
+        A single multinomial draw over the joint distribution gives per-cell
+        counts that always sum to exactly count.
         
-        # Assign remaining to last item
-        if sorted_items:
-            counts[sorted_items[-1][0]] = remaining
+        Args:
+            count (int): Total number of documents
+            first_keys (Tuple[str, ...]): Keys of the first distribution
+            first_p (np.ndarray): Normalized probabilities of the first distribution
+            second_keys (Tuple[str, ...]): Keys of the second distribution
+            second_p (np.ndarray): Normalized probabilities of the second distribution
+            rng (Optional[np.random.Generator]): Random stream (default: self.rng)
+            
+        Returns:
+            List[Tuple[str, str, int]]: (first_key, second_key, count) for non-empty cells
+        """
+        rng = rng if rng is not None else self.rng
+        joint_p = np.outer(first_p, second_p).ravel()
+        cell_counts = rng.multinomial(count, joint_p / joint_p.sum())
+        cell_counts = cell_counts.reshape(len(first_keys), len(second_keys))
+        
+        return [
+            (first_key, second_key, int(cell_counts[i, j]))
+            for i, first_key in enumerate(first_keys)
+            for j, second_key in enumerate(second_keys)
+            if cell_counts[i, j]
+        ]
+    
+    def _distribute_counts(self, total: int, distribution: Dict[str, float]) -> Dict[str, int]:
+        """
+        Distribute total count according to distribution weights.
         
-        return counts
+        Uses largest-remainder apportionment: every key gets the floor of its
+        share and the leftover units go to the largest fractional remainders.
+        """
+        keys, p = _distribution_arrays(distribution)
+        if not keys or p.sum() <= 0:
+            raise ValueError("Distribution weights must sum to a positive value")
+        
+        shares = total * p
+        counts = np.floor(shares).astype(np.int64)
+        remaining = total - int(counts.sum())
+        if remaining > 0:
+            largest = np.argpartition(counts - shares, remaining - 1)[:remaining]
+            counts[largest] += 1
+        
+        return dict(zip(keys, counts.tolist()))
     
     def _calculate_dataset_statistics(self, documents: List[Dict[str, Any]], 
                                     composition: DatasetComposition) -> Dict[str, Any]:
         """Calculate comprehensive dataset statistics."""
+        country_counts = defaultdict(int)
+        corruption_counts = defaultdict(int)
+        document_type_counts = defaultdict(int)
+        pii_documents = 0
+        
+        # Single pass over the documents for all per-document tallies
+        for doc in documents:
+            country_counts[doc.get('country', 'unknown')] += 1
+            corruption_counts[doc.get('corruption_level', 'unknown')] += 1
+            document_type_counts[doc.get('document_type', 'unknown')] += 1
+            if doc.get('has_pii', False):
+                pii_documents += 1
+        
         stats = {
             'total_documents': len(documents),
-            'pii_documents': sum(1 for doc in documents if doc.get('has_pii', False)),
-            'negative_documents': sum(1 for doc in documents if not doc.get('has_pii', False)),
-            'country_distribution': Counter(doc.get('country', 'unknown') for doc in documents),
-            'corruption_distribution': Counter(doc.get('corruption_level', 'unknown') for doc in documents),
-            'document_type_distribution': Counter(doc.get('document_type', 'unknown') for doc in documents),
+            'pii_documents': pii_documents,
+            'negative_documents': len(documents) - pii_documents,
+            'country_distribution': dict(country_counts),
+            'corruption_distribution': dict(corruption_counts),
+            'document_type_distribution': dict(document_type_counts),
             'entity_statistics': self._calculate_entity_statistics(documents),
             'text_statistics': self._calculate_text_statistics(documents)
         }
         
-        # Convert counters to regular dicts for JSON serialization
-        stats['country_distribution'] = dict(stats['country_distribution'])
-        stats['corruption_distribution'] = dict(stats['corruption_distribution'])
-        stats['document_type_distribution'] = dict(stats['document_type_distribution'])
-        
         return stats
     
     def _calculate_entity_statistics(self, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate entity-related statistics."""
         total_entities = 0
-        entity_type_counts = Counter()
+        entity_type_counts = defaultdict(int)
         
         for doc in documents:
             entities = doc.get('entities', [])
             total_entities += len(entities)
             
             for entity in entities:
-                entity_type = entity.get('type', entity.get('label', 'unknown'))
-                entity_type_counts[entity_type] += 1
+                entity_type_counts[entity.get('type') or entity.get('label', 'unknown')] += 1
         
         return {
             'total_entities': total_entities,
@@ -465,16 +594,28 @@ class MixedDatasetGenerator:
     
     def _calculate_text_statistics(self, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate text-related statistics."""
-        word_counts = [len(doc.get('text', '').split()) for doc in documents]
-        char_counts = [len(doc.get('text', '')) for doc in documents]
+        if not documents:
+            return {
+                'average_words_per_document': 0,
+                'average_chars_per_document': 0,
+                'min_words': 0,
+                'max_words': 0,
+                'total_words': 0,
+                'total_characters': 0
+            }
         
+        texts = [doc.get('text', '') for doc in documents]
+        word_counts = np.fromiter((len(text.split()) for text in texts), dtype=np.int64, count=len(texts))
+        char_counts = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+        
+        # Plain Python numbers keep the statistics JSON-serializable
         return {
-            'average_words_per_document': np.mean(word_counts) if word_counts else 0,
-            'average_chars_per_document': np.mean(char_counts) if char_counts else 0,
-            'min_words': min(word_counts) if word_counts else 0,
-            'max_words': max(word_counts) if word_counts else 0,
-            'total_words': sum(word_counts),
-            'total_characters': sum(char_counts)
+            'average_words_per_document': float(word_counts.mean()),
+            'average_chars_per_document': float(char_counts.mean()),
+            'min_words': int(word_counts.min()),
+            'max_words': int(word_counts.max()),
+            'total_words': int(word_counts.sum()),
+            'total_characters': int(char_counts.sum())
         }
     
     def _store_dataset_in_database(self, documents: List[Dict[str, Any]], 
@@ -484,39 +625,40 @@ class MixedDatasetGenerator:
             return
         
         try:
+            doc_rows = []
             for doc in documents:
-                # Store document
-                doc_db_id = self.database_manager.store_document(
-                    document_id=doc.get('document_id', f"mixed_{random.randint(1000, 9999)}"),
-                    country_code=doc.get('country', 'unknown'),
-                    document_type=doc.get('document_type', 'mixed_document'),
-                    corruption_level=doc.get('corruption_level', 'none'),
-                    original_text=doc.get('text', ''),
-                    corrupted_text=doc.get('corrupted_text'),
-                    template_used=doc.get('template_used'),
-                    generation_mode='mixed_dataset',
-                    session_id=session_id
-                )
-                
-                # Store entities
                 entities = doc.get('entities', [])
-                for entity in entities:
-                    self.database_manager.store_entity(
-                        document_db_id=doc_db_id,
-                        entity_type=entity.get('type', entity.get('label', 'unknown')),
-                        original_text=entity.get('text', ''),
-                        corrupted_text=entity.get('corrupted_text', entity.get('text', '')),
-                        start_pos=entity.get('start', 0),
-                        end_pos=entity.get('end', 0),
-                        is_preserved=entity.get('is_preserved', True)
-                    )
-                
-                # Update document stats
-                self.database_manager.update_document_stats(
-                    doc_db_id, len(entities), 
-                    sum(1 for e in entities if e.get('is_preserved', True)),
-                    sum(1 for e in entities if not e.get('is_preserved', True))
-                )
+                preserved = sum(1 for e in entities if e.get('is_preserved', True))
+                doc_rows.append((
+                    doc.get('document_id', f"mixed_{random.randint(1000, 9999)}"),
+                    doc.get('country', 'unknown'),
+                    doc.get('document_type', 'mixed_document'),
+                    doc.get('corruption_level', 'none'),
+                    doc.get('text', ''),
+                    doc.get('corrupted_text'),
+                    doc.get('template_used'),
+                    'mixed_dataset',
+                    len(entities), preserved, len(entities) - preserved
+                ))
+            
+            # Documents and entities go in as one transaction: two executemany
+            # calls instead of several round-trips per document
+            with self.database_manager.get_connection() as conn:
+                doc_db_ids = self.database_manager.bulk_store_documents(doc_rows, session_id, conn)
+                entity_rows = [
+                    (doc_db_id,
+                     entity.get('type') or entity.get('label', 'unknown'),
+                     entity.get('text', ''),
+                     entity.get('corrupted_text', entity.get('text', '')),
+                     entity.get('start', 0),
+                     entity.get('end', 0),
+                     entity.get('is_preserved', True),
+                     1.0)
+                    for doc_db_id, doc in zip(doc_db_ids, documents)
+                    for entity in doc.get('entities', [])
+                ]
+                self.database_manager.bulk_store_entities(entity_rows, conn)
+                conn.commit()
             
             logger.info(f"Stored {len(documents)} documents in database for session {session_id}")
             
@@ -531,7 +673,9 @@ class MixedDatasetGenerator:
         Args:
             dataset (Dict[str, Any]): Generated dataset
             output_dir (str): Output directory
-            formats (List[str]): Export formats ('spacy', 'json', 'csv')
+            formats (List[str]): Export formats ('spacy', 'json', 'csv', 'transformers').
+                'json' writes mixed_dataset_{train,dev}.jsonl plus a
+                mixed_dataset_meta.json sidecar
             
         Returns:
             Dict[str, str]: Mapping of format to file path
@@ -546,85 +690,74 @@ class MixedDatasetGenerator:
         
         for format_type in formats:
             if format_type == 'json':
-                file_path = output_path / 'mixed_dataset.json'
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(dataset, f, indent=2, ensure_ascii=False, default=str)
-                exported_files['json'] = str(file_path)
+                # One document per line (JSON Lines) for each split
+                for split in ('train', 'dev'):
+                    file_path = output_path / f'mixed_dataset_{split}.jsonl'
+                    with open(file_path, 'wb') as f:
+                        for doc in dataset.get(f'{split}_documents', []):
+                            f.write(_json_bytes(doc))
+                            f.write(b'\n')
+                    exported_files[f'json_{split}'] = str(file_path)
+                
+                # Composition, statistics and metadata go to a small sidecar file
+                meta_path = output_path / 'mixed_dataset_meta.json'
+                meta = {key: value for key, value in dataset.items()
+                        if key not in ('train_documents', 'dev_documents')}
+                with open(meta_path, 'wb') as f:
+                    f.write(_json_bytes(meta))
+                exported_files['json_meta'] = str(meta_path)
             
             elif format_type == 'spacy':
                 # Export spaCy format using format converter
                 try:
+                    from .format_converters import SpacyFormatConverter
                     spacy_converter = SpacyFormatConverter(language='es')
                     
-                    # Convert and save train data
-                    train_path = output_path / 'train.spacy'
-                    if dataset.get('train_documents'):
-                        success_train = spacy_converter.convert_and_save(
-                            dataset['train_documents'], str(train_path)
-                        )
-                        if success_train:
-                            exported_files['spacy_train'] = str(train_path)
-                    
-                    # Convert and save dev data
-                    dev_path = output_path / 'dev.spacy'
-                    if dataset.get('dev_documents'):
-                        success_dev = spacy_converter.convert_and_save(
-                            dataset['dev_documents'], str(dev_path)
-                        )
-                        if success_dev:
-                            exported_files['spacy_dev'] = str(dev_path)
+                    # Convert train and dev data in one tokenizer pass
+                    splits = {split: dataset[f'{split}_documents'] for split in ('train', 'dev')
+                              if dataset.get(f'{split}_documents')}
+                    saved_files = spacy_converter.convert_and_save_many(splits, str(output_path))
+                    for split, file_path in saved_files.items():
+                        exported_files[f'spacy_{split}'] = file_path
                     
-                    logger.info(f"spaCy export completed: train={train_path.exists()}, dev={dev_path.exists()}")
+                    logger.info(f"spaCy export completed: train={'train' in saved_files}, dev={'dev' in saved_files}")
                     
                 except Exception as e:
                     logger.error(f"Failed to export spaCy format: {e}")
                     # Continue with other formats even if spaCy export fails
             
             elif format_type == 'csv':
-                # Export CSV format for analysis
-                import pandas as pd
-                
-                # Flatten documents for CSV
-                rows = []
-                for doc in dataset['train_documents'] + dataset['dev_documents']:
-                    rows.append({
-                        'text': doc.get('text', ''),
-                        'country': doc.get('country', ''),
-                        'corruption_level': doc.get('corruption_level', ''),
-                        'document_type': doc.get('document_type', ''),
-                        'has_pii': doc.get('has_pii', False),
-                        'entity_count': len(doc.get('entities', []))
-                    })
-                
-                df = pd.DataFrame(rows)
+                # Export CSV format for analysis, streaming one row per document
                 csv_path = output_path / 'mixed_dataset.csv'
-                df.to_csv(csv_path, index=False)
+                with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f, lineterminator='\n')
+                    writer.writerow(['text', 'country', 'corruption_level', 'document_type',
+                                     'has_pii', 'entity_count'])
+                    for doc in chain(dataset['train_documents'], dataset['dev_documents']):
+                        writer.writerow((
+                            doc.get('text', ''),
+                            doc.get('country', ''),
+                            doc.get('corruption_level', ''),
+                            doc.get('document_type', ''),
+                            doc.get('has_pii', False),
+                            len(doc.get('entities', []))
+                        ))
                 exported_files['csv'] = str(csv_path)
             
             elif format_type in ['transformers', 'conll', 'bio']:
                 # Export Transformers/CONLL format using format converter
                 try:
+                    from .format_converters import TransformersFormatConverter
                     transformers_converter = TransformersFormatConverter(tokenization_method='whitespace')
                     
-                    # Convert and save train data
-                    train_path = output_path / 'train.conll'
-                    if dataset.get('train_documents'):
-                        success_train = transformers_converter.convert_and_save(
-                            dataset['train_documents'], str(train_path)
-                        )
-                        if success_train:
-                            exported_files['transformers_train'] = str(train_path)
-                    
-                    # Convert and save dev data
-                    dev_path = output_path / 'dev.conll'
-                    if dataset.get('dev_documents'):
-                        success_dev = transformers_converter.convert_and_save(
-                            dataset['dev_documents'], str(dev_path)
-                        )
-                        if success_dev:
-                            exported_files['transformers_dev'] = str(dev_path)
+                    # Convert and save train and dev data
+                    splits = {split: dataset[f'{split}_documents'] for split in ('train', 'dev')
+                              if dataset.get(f'{split}_documents')}
+                    saved_files = transformers_converter.convert_and_save_many(splits, str(output_path))
+                    for split, file_path in saved_files.items():
+                        exported_files[f'transformers_{split}'] = file_path
                     
-                    logger.info(f"Transformers export completed: train={train_path.exists()}, dev={dev_path.exists()}")
+                    logger.info(f"Transformers export completed: train={'train' in saved_files}, dev={'dev' in saved_files}")
                     
                 except Exception as e:
                     logger.error(f"Failed to export Transformers format: {e}")
@@ -648,18 +781,32 @@ class MixedDatasetGenerator:
         if abs(composition.pii_ratio + composition.negative_ratio - 1.0) > 0.001:
             errors.append("PII ratio and negative ratio must sum to 1.0")
         
-        # Check distribution sums
-        if abs(sum(composition.corruption_distribution.values()) - 1.0) > 0.001:
-            errors.append("Corruption distribution must sum to 1.0")
-        
-        if abs(sum(composition.country_distribution.values()) - 1.0) > 0.001:
-            errors.append("Country distribution must sum to 1.0")
-        
-        if abs(sum(composition.negative_doc_types.values()) - 1.0) > 0.001:
-            errors.append("Negative document types distribution must sum to 1.0")
+        # Check distribution sums and weights
+        errors.extend(_check_distribution("Corruption distribution", composition.corruption_distribution))
+        errors.extend(_check_distribution("Country distribution", composition.country_distribution))
+        errors.extend(_check_distribution("Negative document types distribution", composition.negative_doc_types))
         
         # Check for negative values
         if any(v < 0 for v in [composition.pii_ratio, composition.negative_ratio]):
             errors.append("Ratios cannot be negative")
         
         return len(errors) == 0, errors
+
+
+def _worker_generate_pii(job: Tuple[Any, int, str, str, DatasetComposition, int]) -> List[Dict[str, Any]]:
+    """
+    Generate one country-corruption batch of PII documents in a worker process.
+    
+    Both the standard library and NumPy random streams are seeded from the
+    job's seed so parallel batches never share or overlap random state.
+    
+    Args:
+        job: (pii_generator, count, country, corruption_level, composition, seed)
+        
+    Returns:
+        List[Dict[str, Any]]: Generated PII documents
+    """
+    pii_generator, count, country, corruption_level, composition, seed = job
+    random.seed(seed)
+    generator = MixedDatasetGenerator(pii_generator=pii_generator, seed=seed, max_workers=1)
+    return generator._generate_pii_batch(count, country, corruption_level, composition)
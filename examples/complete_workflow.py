@@ -28,10 +28,28 @@ from corruption.extreme_corruption import ExtremeCorruptionGenerator
 from dataset_composer.mixed_dataset_generator import MixedDatasetGenerator, DatasetComposition
 from main_pipeline import EnhancedPIIDataPipeline
 
+# Optional fast JSON serializer for the saved results
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def save_json(path: Path, obj) -> None:
+    """Write an object as indented UTF-8 JSON, using orjson when it is available."""
+    if orjson is None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False, default=str)
+        return
+    
+    options = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS |
+               orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(obj, default=str, option=options))
+
 def demonstrate_database_integration():
     """Demonstrate database integration capabilities."""
     print("\n" + "="*60)
@@ -270,10 +288,17 @@ def demonstrate_spacy_config_generation():
     config_dir = Path("examples/configs")
     config_dir.mkdir(exist_ok=True)
     
-    # Generate different optimization levels
-    optimization_levels = ['fast', 'balanced', 'accurate']
+    # Settings per optimization level
+    level_settings = {
+        'fast': {'batch_size': 1000, 'hidden_width': 64, 'maxout_pieces': 2,
+                 'max_steps': 10000, 'dropout': 0.1, 'learn_rate': 0.001},
+        'balanced': {'batch_size': 2000, 'hidden_width': 128, 'maxout_pieces': 3,
+                     'max_steps': 20000, 'dropout': 0.15, 'learn_rate': 0.0005},
+        'accurate': {'batch_size': 3000, 'hidden_width': 256, 'maxout_pieces': 4,
+                     'max_steps': 30000, 'dropout': 0.2, 'learn_rate': 0.0001}
+    }
     
-    for level in optimization_levels:
+    for level, settings in level_settings.items():
         config_path = config_dir / f"{level}_config.cfg"
         
         # Create basic configuration (in real implementation, would use actual config generation)
@@ -292,7 +317,7 @@ seed = 42
 [nlp]
 lang = "es"
 pipeline = ["tok2vec","ner"]
-batch_size = {1000 if level == 'fast' else 2000 if level == 'balanced' else 3000}
+batch_size = {settings['batch_size']}
 
 [components]
 
@@ -302,25 +327,28 @@ factory = "ner"
 [components.ner.model]
 @architectures = "spacy.TransitionBasedParser.v2"
 state_type = "ner"
-hidden_width = {64 if level == 'fast' else 128 if level == 'balanced' else 256}
-maxout_pieces = {2 if level == 'fast' else 3 if level == 'balanced' else 4}
+hidden_width = {settings['hidden_width']}
+maxout_pieces = {settings['maxout_pieces']}
 
 [training]
-max_steps = {10000 if level == 'fast' else 20000 if level == 'balanced' else 30000}
-dropout = {0.1 if level == 'fast' else 0.15 if level == 'balanced' else 0.2}
+max_steps = {settings['max_steps']}
+dropout = {settings['dropout']}
 
 [training.optimizer]
 @optimizers = "Adam.v1"
-learn_rate = {0.001 if level == 'fast' else 0.0005 if level == 'balanced' else 0.0001}
+learn_rate = {settings['learn_rate']}
         """.strip()
         
         with open(config_path, 'w') as f:
             f.write(config_content)
         
-        print(f"✅ Generated {level} configuration: {config_path}")
-        print(f"   Batch size: {1000 if level == 'fast' else 2000 if level == 'balanced' else 3000}")
-        print(f"   Hidden width: {64 if level == 'fast' else 128 if level == 'balanced' else 256}")
-        print(f"   Max steps: {10000 if level == 'fast' else 20000 if level == 'balanced' else 30000}")
+        # One write for the whole summary block
+        print("\n".join((
+            f"✅ Generated {level} configuration: {config_path}",
+            f"   Batch size: {settings['batch_size']}",
+            f"   Hidden width: {settings['hidden_width']}",
+            f"   Max steps: {settings['max_steps']}"
+        )))
 
 def demonstrate_complete_pipeline():
     """Demonstrate the complete enhanced pipeline."""
@@ -401,8 +429,7 @@ def save_demonstration_results(db, dataset, negatives, pipeline):
         }
     }
     
-    with open(results_dir / 'dataset_summary.json', 'w', encoding='utf-8') as f:
-        json.dump(dataset_summary, f, indent=2, ensure_ascii=False, default=str)
+    save_json(results_dir / 'dataset_summary.json', dataset_summary)
     
     # Save negative examples summary
     negative_summary = {
@@ -415,18 +442,15 @@ def save_demonstration_results(db, dataset, negatives, pipeline):
         'samples': negatives[:3]
     }
     
-    with open(results_dir / 'negative_examples_summary.json', 'w', encoding='utf-8') as f:
-        json.dump(negative_summary, f, indent=2, ensure_ascii=False, default=str)
+    save_json(results_dir / 'negative_examples_summary.json', negative_summary)
     
     # Save database statistics
     db_stats = db.get_database_stats()
-    with open(results_dir / 'database_statistics.json', 'w', encoding='utf-8') as f:
-        json.dump(db_stats, f, indent=2, ensure_ascii=False, default=str)
+    save_json(results_dir / 'database_statistics.json', db_stats)
     
     # Save pipeline statistics
     pipeline_stats = pipeline.get_pipeline_statistics()
-    with open(results_dir / 'pipeline_statistics.json', 'w', encoding='utf-8') as f:
-        json.dump(pipeline_stats, f, indent=2, ensure_ascii=False, default=str)
+    save_json(results_dir / 'pipeline_statistics.json', pipeline_stats)
     
     print(f"✅ Results saved to: {results_dir}")
     print(f"   - dataset_summary.json")
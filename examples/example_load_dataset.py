@@ -3,36 +3,194 @@
 Example script demonstrating how to load and use the generated NER dataset
 """
 
+import array
 import json
 import csv
-from collections import Counter
-from typing import List, Dict
+import functools
+import hashlib
+import os
+import pickle
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from operator import itemgetter
+from typing import Iterable, Iterator, List, Dict, NamedTuple, Union
 
+import numpy as np
 
+# orjson parses bytes directly and is much faster; fall back to stdlib json
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+
+def write_lines(lines: List[str]) -> None:
+    """Write a block of lines to stdout with one call instead of one print each"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def print_json(obj) -> None:
+    """Pretty-print an object as JSON, using orjson when it is available"""
+    if orjson is None:
+        print(json.dumps(obj, indent=2, ensure_ascii=False))
+        return
+    
+    payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        sys.stdout.write(payload.decode('utf-8'))
+        return
+    # Write the encoded bytes directly, after any text still queued by print()
+    sys.stdout.flush()
+    buffer.write(payload)
+    buffer.flush()
+
+
+# Bytes read per chunk when streaming JSONL files
+JSONL_CHUNK_SIZE = 1 << 20
+
+# Fetch several sample/entity fields in one C-level call
+_SAMPLE_FIELDS = itemgetter('language', 'text', 'entities')
+_ENTITY_LABEL_TEXT = itemgetter('label', 'text')
+
+# Parsed files are memoized in a per-user cache directory, never beside the
+# data, so a shared dataset folder cannot plant pickles for the loader to run
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'ner_loader')
+
+
+def _private_cache_dir() -> bool:
+    """Create CACHE_DIR user-only; False if it exists but others could write to it"""
+    os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+    stat = os.stat(CACHE_DIR)
+    if hasattr(os, 'getuid') and stat.st_uid != os.getuid():
+        return False
+    return not stat.st_mode & 0o022
+
+
+def disk_cached(loader):
+    """
+    Memoize a file loader's result on disk as a pickle.
+    
+    Cache entries live in CACHE_DIR, created with user-only permissions, and
+    are named after the SHA-256 of the loader name and the file's path,
+    modification time and size. A pickle is only read when its name matches
+    the file's current key, so editing or regenerating the file invalidates
+    it. Pass use_cache=False to bypass it.
+    """
+    @functools.wraps(loader)
+    def wrapper(filepath: str, use_cache: bool = True):
+        if not use_cache:
+            return loader(filepath)
+        
+        path = os.path.abspath(filepath)
+        stat = os.stat(path)
+        key = (loader.__name__, path, stat.st_mtime_ns, stat.st_size)
+        digest = hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+        cache_path = os.path.join(CACHE_DIR, f"{digest}.pkl")
+        
+        try:
+            cache_usable = _private_cache_dir()
+        except OSError:
+            cache_usable = False  # caching is best effort, e.g. no writable home
+        if not cache_usable:
+            return loader(filepath)
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_key, data = pickle.load(f)
+            if cached_key == key:
+                return data
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            pass
+        
+        data = loader(filepath)
+        try:
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+        return data
+    
+    return wrapper
+
+
+def iter_jsonl(filepath: str) -> Iterator[Dict]:
+    """Stream samples from a JSONL file, reading it in large binary chunks"""
+    loads = _loads  # local binding, looked up once instead of per line
+    remainder = b''
+    with open(filepath, 'rb') as f:
+        read = f.read
+        while True:
+            chunk = read(JSONL_CHUNK_SIZE)
+            if not chunk:
+                break
+            lines = (remainder + chunk).split(b'\n')
+            remainder = lines.pop()  # incomplete last line, finished by the next chunk
+            for line in lines:
+                if line and not line.isspace():
+                    yield loads(line)
+    
+    if remainder and not remainder.isspace():
+        yield loads(remainder)
+
+
+def _intern_codes(sample: Dict) -> Dict:
+    """
+    Intern a sample's language and entity label strings in place.
+    
+    Both come from a handful of distinct values, so every sample ends up
+    sharing one string object per value instead of holding its own copy,
+    and Counter/dict lookups on them hit the identity fast path.
+    """
+    intern = sys.intern
+    language = sample.get('language')
+    if isinstance(language, str):
+        sample['language'] = intern(language)
+    for entity in sample.get('entities', ()):
+        label = entity.get('label')
+        if isinstance(label, str):
+            entity['label'] = intern(label)
+    return sample
+
+
+@disk_cached
 def load_jsonl(filepath: str) -> List[Dict]:
     """Load JSONL file"""
-    data = []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        for line in f:
-            data.append(json.loads(line))
-    return data
+    intern_codes = _intern_codes
+    return [intern_codes(sample) for sample in iter_jsonl(filepath)]
+
+
+def load_json(filepath: str) -> Dict:
+    """Load JSON file"""
+    with open(filepath, 'rb') as f:
+        return _loads(f.read())
 
 
+@disk_cached
 def load_conll(filepath: str) -> List[List[tuple]]:
     """Load CONLL/BIO format file"""
     sentences = []
     current_sentence = []
     
     with open(filepath, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                if current_sentence:
-                    sentences.append(current_sentence)
-                    current_sentence = []
-            else:
-                token, tag = line.split('\t')
-                current_sentence.append((token, tag))
+        lines = f.read().splitlines()
+    
+    for line in lines:
+        if not line or line.isspace():
+            if current_sentence:
+                sentences.append(current_sentence)
+                current_sentence = []
+        else:
+            # partition returns a fixed 3-tuple, no list allocation per token
+            token, _, tag = line.partition('\t')
+            current_sentence.append((token, tag))
     
     if current_sentence:
         sentences.append(current_sentence)
@@ -40,86 +198,356 @@ def load_conll(filepath: str) -> List[List[tuple]]:
     return sentences
 
 
-def analyze_dataset(data: List[Dict]):
-    """Analyze and print statistics about the dataset"""
-    print("\n" + "="*60)
-    print("📊 DATASET ANALYSIS")
-    print("="*60)
-    
-    # Basic stats
-    print(f"\n📈 Total Samples: {len(data)}")
+# Distinct languages or entity labels a ColumnarDataset can encode (uint16 codes)
+MAX_CODES = 1 << 16
+
+
+@dataclass
+class ColumnarDataset:
+    """
+    Samples stored column-wise (structure of arrays) instead of one dict each.
+    
+    Languages and entity labels are small closed sets, so they are stored as
+    uint16 codes into the `languages` and `labels` vocabularies. Entity columns
+    are flat arrays across the whole dataset; `entity_sample` holds the index
+    of the sample each entity belongs to.
+    """
+    texts: List[str]
+    language_ids: np.ndarray
+    languages: List[str]
+    entity_sample: np.ndarray
+    entity_start: np.ndarray
+    entity_end: np.ndarray
+    entity_label_ids: np.ndarray
+    labels: List[str]
+    entity_texts: List[str]
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+
+
+def load_jsonl_soa(filepath: str) -> ColumnarDataset:
+    """Stream a JSONL file straight into a ColumnarDataset"""
+    language_codes: Dict[str, int] = {}
+    label_codes: Dict[str, int] = {}
+    texts, entity_texts = [], []
+    # Typed arrays grow geometrically and are handed to NumPy without copying
+    language_ids = array.array('H')
+    entity_sample, entity_start, entity_end = array.array('i'), array.array('i'), array.array('i')
+    entity_label_ids = array.array('H')
+    
+    try:
+        for index, sample in enumerate(iter_jsonl(filepath)):
+            texts.append(sample['text'])
+            language_ids.append(language_codes.setdefault(sample['language'], len(language_codes)))
+            for entity in sample['entities']:
+                entity_sample.append(index)
+                entity_start.append(entity['start'])
+                entity_end.append(entity['end'])
+                entity_label_ids.append(label_codes.setdefault(entity['label'], len(label_codes)))
+                entity_texts.append(entity['text'])
+    except OverflowError:
+        if max(len(language_codes), len(label_codes)) <= MAX_CODES:
+            raise  # an offset that does not fit in a C int
+        raise ValueError(
+            f"{filepath}: more than {MAX_CODES} distinct languages or entity labels; "
+            f"use load_jsonl instead"
+        ) from None
+    
+    return ColumnarDataset(
+        texts=texts,
+        language_ids=np.frombuffer(language_ids, dtype=np.uint16),
+        languages=list(language_codes),
+        entity_sample=np.frombuffer(entity_sample, dtype=np.intc),
+        entity_start=np.frombuffer(entity_start, dtype=np.intc),
+        entity_end=np.frombuffer(entity_end, dtype=np.intc),
+        entity_label_ids=np.frombuffer(entity_label_ids, dtype=np.uint16),
+        labels=list(label_codes),
+        entity_texts=entity_texts
+    )
+
+
+class ValueRange(NamedTuple):
+    """Total, minimum and maximum of a per-sample quantity"""
+    total: int = 0
+    min: int = 0
+    max: int = 0
+
+
+def _value_range(values: Iterable[int]) -> ValueRange:
+    """Summarize a stream of integers without materializing it"""
+    total = count = low = high = 0
+    for value in values:
+        if count == 0:
+            low = high = value
+        elif value < low:
+            low = value
+        elif value > high:
+            high = value
+        total += value
+        count += 1
+    return ValueRange(total, low, high)
+
+
+class DatasetStats:
+    """
+    Dataset statistics computed lazily, field by field.
+    
+    Each field is computed on first access with its own pass over the samples,
+    so a caller that only needs the language counts pays only for those; lazy
+    fields need a collection that can be iterated more than once.
+    compute_all() fills every field in one fused pass instead, which also
+    works on a one-shot iterator such as iter_jsonl().
+    """
+    
+    def __init__(self, data: Iterable[Dict]):
+        self.data = data
+    
+    @functools.cached_property
+    def total_samples(self) -> int:
+        try:
+            return len(self.data)
+        except TypeError:
+            return sum(1 for _ in self.data)
+    
+    @functools.cached_property
+    def languages(self) -> Counter:
+        return Counter(sample['language'] for sample in self.data)
+    
+    @functools.cached_property
+    def label_counts(self) -> Counter:
+        return Counter(entity['label'] for sample in self.data for entity in sample['entities'])
+    
+    @functools.cached_property
+    def entities_per_sample(self) -> ValueRange:
+        return _value_range(len(sample['entities']) for sample in self.data)
+    
+    @functools.cached_property
+    def text_lengths(self) -> ValueRange:
+        return _value_range(len(sample['text']) for sample in self.data)
+    
+    def compute_all(self) -> 'DatasetStats':
+        """Compute every field in a single pass over the samples"""
+        languages = Counter()
+        label_counts = Counter()
+        total_samples = 0
+        total_entities = min_entities = max_entities = 0
+        total_length = min_length = max_length = 0
+        
+        count_labels = label_counts.update
+        for language, text, entities in map(_SAMPLE_FIELDS, self.data):
+            languages[language] += 1
+            # Counter.update counts an iterable in C
+            count_labels(entity['label'] for entity in entities)
+            
+            num_entities = len(entities)
+            text_length = len(text)
+            if total_samples == 0:
+                min_entities = max_entities = num_entities
+                min_length = max_length = text_length
+            else:
+                if num_entities < min_entities:
+                    min_entities = num_entities
+                elif num_entities > max_entities:
+                    max_entities = num_entities
+                if text_length < min_length:
+                    min_length = text_length
+                elif text_length > max_length:
+                    max_length = text_length
+            
+            total_samples += 1
+            total_entities += num_entities
+            total_length += text_length
+        
+        # Assigning the attributes pre-populates the cached properties
+        self.total_samples = total_samples
+        self.languages = languages
+        self.label_counts = label_counts
+        self.entities_per_sample = ValueRange(total_entities, min_entities, max_entities)
+        self.text_lengths = ValueRange(total_length, min_length, max_length)
+        # Nothing is left to compute, so don't keep the samples alive
+        self.data = None
+        return self
+    
+    @classmethod
+    def from_columns(cls, dataset: ColumnarDataset) -> 'DatasetStats':
+        """Compute every field of a ColumnarDataset with NumPy aggregations"""
+        stats = cls(dataset)
+        num_samples = len(dataset)
+        
+        language_counts = np.bincount(dataset.language_ids, minlength=len(dataset.languages))
+        label_counts = np.bincount(dataset.entity_label_ids, minlength=len(dataset.labels))
+        entity_counts = np.bincount(dataset.entity_sample, minlength=num_samples)
+        text_lengths = np.fromiter(map(len, dataset.texts), dtype=np.int64, count=num_samples)
+        
+        def value_range(values: np.ndarray) -> ValueRange:
+            if not values.size:
+                return ValueRange()
+            return ValueRange(int(values.sum()), int(values.min()), int(values.max()))
+        
+        stats.total_samples = num_samples
+        stats.languages = Counter(dict(zip(dataset.languages, language_counts.tolist())))
+        stats.label_counts = Counter(dict(zip(dataset.labels, label_counts.tolist())))
+        stats.entities_per_sample = value_range(entity_counts)
+        stats.text_lengths = value_range(text_lengths)
+        return stats
+
+
+def analyze_dataset(data: Union[Iterable[Dict], ColumnarDataset]) -> DatasetStats:
+    """
+    Analyze and print statistics about the dataset
+    
+    Samples are consumed in a single pass, so `data` may be a one-shot
+    iterator such as iter_jsonl(path); memory use then stays flat no matter
+    how large the file is.
+    """
+    if isinstance(data, ColumnarDataset):
+        stats = DatasetStats.from_columns(data)
+    else:
+        stats = DatasetStats(data).compute_all()
+    total_samples = stats.total_samples
+    
+    # Build the whole report, then write it with a single call
+    lines = [
+        "\n" + "="*60,
+        "📊 DATASET ANALYSIS",
+        "="*60,
+        # Basic stats
+        f"\n📈 Total Samples: {total_samples}"
+    ]
+    if not total_samples:
+        write_lines(lines)
+        return stats
     
     # Language distribution
-    languages = Counter(sample['language'] for sample in data)
-    print(f"\n🌍 Language Distribution:")
-    for lang, count in languages.most_common():
-        percentage = (count / len(data)) * 100
-        print(f"   {lang.upper()}: {count} ({percentage:.1f}%)")
+    lines.append("\n🌍 Language Distribution:")
+    lines.extend("   %s: %d (%.1f%%)" % (lang.upper(), count, count / total_samples * 100)
+                 for lang, count in stats.languages.most_common())
     
     # Entity type distribution
-    entity_labels = []
-    for sample in data:
-        for entity in sample['entities']:
-            entity_labels.append(entity['label'])
-    
-    label_counts = Counter(entity_labels)
-    print(f"\n🏷️  Entity Type Distribution:")
-    for label, count in label_counts.most_common():
-        percentage = (count / len(entity_labels)) * 100
-        print(f"   {label}: {count} ({percentage:.1f}%)")
+    entities = stats.entities_per_sample
+    lines.append("\n🏷️  Entity Type Distribution:")
+    lines.extend("   %s: %d (%.1f%%)" % (label, count, count / entities.total * 100)
+                 for label, count in stats.label_counts.most_common())
     
     # Entities per sample
-    entities_per_sample = [len(sample['entities']) for sample in data]
-    avg_entities = sum(entities_per_sample) / len(entities_per_sample)
-    print(f"\n📊 Entities per Sample:")
-    print(f"   Average: {avg_entities:.2f}")
-    print(f"   Min: {min(entities_per_sample)}")
-    print(f"   Max: {max(entities_per_sample)}")
+    lines.extend((
+        "\n📊 Entities per Sample:",
+        f"   Average: {entities.total / total_samples:.2f}",
+        f"   Min: {entities.min}",
+        f"   Max: {entities.max}"
+    ))
     
     # Text length distribution
-    text_lengths = [len(sample['text']) for sample in data]
-    avg_length = sum(text_lengths) / len(text_lengths)
-    print(f"\n📏 Text Length (characters):")
-    print(f"   Average: {avg_length:.1f}")
-    print(f"   Min: {min(text_lengths)}")
-    print(f"   Max: {max(text_lengths)}")
+    lengths = stats.text_lengths
+    lines.extend((
+        "\n📏 Text Length (characters):",
+        f"   Average: {lengths.total / total_samples:.1f}",
+        f"   Min: {lengths.min}",
+        f"   Max: {lengths.max}"
+    ))
+    
+    write_lines(lines)
+    return stats
 
 
-def show_examples(data: List[Dict], num_examples: int = 5):
-    """Show example samples"""
-    print("\n" + "="*60)
-    print("📝 EXAMPLE SAMPLES")
-    print("="*60)
-    
-    for i, sample in enumerate(data[:num_examples], 1):
-        print(f"\n--- Example {i} ---")
-        print(f"Language: {sample['language'].upper()}")
-        print(f"Text: {sample['text']}")
-        print(f"Entities ({len(sample['entities'])}):")
-        for entity in sample['entities']:
-            print(f"   [{entity['label']}] \"{entity['text']}\" (pos: {entity['start']}-{entity['end']})")
+def show_examples(data: Iterable[Dict], num_examples: int = 5):
+    """Show example samples (works on lists and one-shot iterators alike)"""
+    lines = ["\n" + "="*60, "📝 EXAMPLE SAMPLES", "="*60]
+    
+    for i, (language, text, entities) in enumerate(map(_SAMPLE_FIELDS, islice(data, num_examples)), 1):
+        lines.extend((
+            f"\n--- Example {i} ---",
+            f"Language: {language.upper()}",
+            f"Text: {text}",
+            f"Entities ({len(entities)}):"
+        ))
+        lines.extend('   [%(label)s] "%(text)s" (pos: %(start)s-%(end)s)' % entity for entity in entities)
+    
+    write_lines(lines)
 
 
-def show_bio_examples(sentences: List[List[tuple]], num_examples: int = 3):
+def show_bio_examples(sentences: Iterable[List[tuple]], num_examples: int = 3):
     """Show example BIO-tagged sentences"""
-    print("\n" + "="*60)
-    print("🏷️  BIO FORMAT EXAMPLES")
-    print("="*60)
+    lines = ["\n" + "="*60, "🏷️  BIO FORMAT EXAMPLES", "="*60]
     
-    for i, sentence in enumerate(sentences[:num_examples], 1):
-        print(f"\n--- Sentence {i} ---")
-        for token, tag in sentence:
-            print(f"{token:20s} {tag}")
+    for i, sentence in enumerate(islice(sentences, num_examples), 1):
+        lines.append(f"\n--- Sentence {i} ---")
+        lines.extend(f"{token:20s} {tag}" for token, tag in sentence)
+    
+    write_lines(lines)
+
+
+def bio_span_stats(sentences: List[List[tuple]]) -> Dict[str, Dict[str, float]]:
+    """
+    Count entity spans and their average length (in tokens) per label.
+    
+    Tags are encoded once to small integer IDs and the span scan runs as
+    NumPy array operations instead of a Python loop per token. An I- tag that
+    does not continue a span of the same label starts a new span.
+    """
+    tag_ids = {}
+    tags = [tag_ids.setdefault(tag, len(tag_ids)) for sentence in sentences for _, tag in sentence]
+    if not tags:
+        return {}
+    
+    labels = sorted({tag[2:] for tag in tag_ids if tag[:2] in ('B-', 'I-')})
+    label_ids = {label: i for i, label in enumerate(labels)}
+    # Per tag ID: prefix (0 = O, 1 = B, 2 = I) and label ID (-1 for O)
+    prefix_of = np.array([{'B-': 1, 'I-': 2}.get(tag[:2], 0) for tag in tag_ids], dtype=np.int8)
+    label_of = np.array([label_ids.get(tag[2:], -1) if tag[:2] in ('B-', 'I-') else -1
+                         for tag in tag_ids], dtype=np.int16)
+    
+    ids = np.array(tags, dtype=np.int8 if len(tag_ids) <= 127 else np.int16)
+    prefix = prefix_of[ids]
+    label = label_of[ids]
+    
+    sentence_start = np.zeros(len(ids), dtype=bool)
+    sentence_lengths = [len(sentence) for sentence in sentences if sentence]
+    sentence_start[np.cumsum([0] + sentence_lengths[:-1])] = True
+    
+    is_entity = prefix != 0
+    continues = (prefix == 2) & ~sentence_start
+    continues[1:] &= (label[1:] == label[:-1]) & is_entity[:-1]
+    continues[0] = False
+    starts = is_entity & ~continues
+    
+    span_index = np.cumsum(starts) - 1
+    span_lengths = np.bincount(span_index[is_entity], minlength=int(starts.sum()))
+    span_labels = label[starts]
+    span_counts = np.bincount(span_labels, minlength=len(labels))
+    token_counts = np.bincount(span_labels, weights=span_lengths, minlength=len(labels))
+    
+    return {
+        name: {'spans': int(span_counts[i]), 'avg_length': float(token_counts[i] / span_counts[i])}
+        for i, name in enumerate(labels) if span_counts[i]
+    }
 
 
 def extract_entities_by_type(data: List[Dict], entity_type: str) -> List[str]:
     """Extract all entities of a specific type"""
-    entities = set()
-    for sample in data:
-        for entity in sample['entities']:
-            if entity['label'] == entity_type:
-                entities.add(entity['text'])
-    return sorted(list(entities))
+    # dict.fromkeys dedups like a set; sorted() reads the keys directly
+    entities = dict.fromkeys(
+        text
+        for sample_entities in map(itemgetter('entities'), data)
+        for label, text in map(_ENTITY_LABEL_TEXT, sample_entities)
+        if label == entity_type
+    )
+    return sorted(entities)
+
+
+def index_entities_by_type(data: List[Dict]) -> Dict[str, Dict[str, None]]:
+    """
+    Collect the unique entity texts of every type in one pass
+    
+    Each type maps to an insertion-ordered dict used as a set (values are
+    None); pass it to sorted() for an alphabetical list.
+    """
+    index = defaultdict(dict)
+    for sample_entities in map(itemgetter('entities'), data):
+        for label, text in map(_ENTITY_LABEL_TEXT, sample_entities):
+            index[label][text] = None
+    return index
 
 
 def demo_transformer_format(data: List[Dict]):
@@ -130,7 +558,7 @@ def demo_transformer_format(data: List[Dict]):
     
     sample = data[0]
     print(f"\nOriginal format (JSONL):")
-    print(json.dumps(sample, indent=2, ensure_ascii=False))
+    print_json(sample)
     
     print(f"\n\nFor transformer training, you would:")
     print("1. Tokenize the text (e.g., using BertTokenizer)")
@@ -162,8 +590,6 @@ def demo_transformer_format(data: List[Dict]):
 
 def main():
     """Main demo function"""
-    import os
-    
     dataset_dir = 'ner_dataset'
     
     # Check if dataset exists
@@ -173,14 +599,34 @@ def main():
         print(f"   python generate_ner_dataset_address_sex.py")
         return
     
+    # The demo needs the JSONL files; CONLL and stats sections are skipped
+    # when the dataset was generated without them (see --formats)
+    train_path = f'{dataset_dir}/train.jsonl'
+    val_path = f'{dataset_dir}/val.jsonl'
+    conll_path = f'{dataset_dir}/train.conll'
+    stats_path = f'{dataset_dir}/dataset_stats.json'
+    
+    if not (os.path.exists(train_path) and os.path.exists(val_path)):
+        print(f"❌ JSONL files not found in '{dataset_dir}'!")
+        print(f"\n💡 Generate the dataset with JSONL output by running:")
+        print(f"   python generate_ner_dataset_address_sex.py --formats jsonl conll")
+        return
+    
     print("="*60)
     print("🎯 NER DATASET LOADER - DEMO")
     print("="*60)
     
+    # The files are independent, so read and parse them all concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        train_future = executor.submit(load_jsonl, train_path)
+        val_future = executor.submit(load_jsonl, val_path)
+        bio_future = executor.submit(load_conll, conll_path) if os.path.exists(conll_path) else None
+        stats_future = executor.submit(load_json, stats_path) if os.path.exists(stats_path) else None
+    
     # Load JSONL data
     print(f"\n📂 Loading JSONL data...")
-    train_data = load_jsonl(f'{dataset_dir}/train.jsonl')
-    val_data = load_jsonl(f'{dataset_dir}/val.jsonl')
+    train_data = train_future.result()
+    val_data = val_future.result()
     print(f"✅ Loaded {len(train_data)} training samples")
     print(f"✅ Loaded {len(val_data)} validation samples")
     
@@ -191,24 +637,33 @@ def main():
     show_examples(train_data, num_examples=3)
     
     # Load CONLL data
-    print(f"\n📂 Loading CONLL/BIO data...")
-    train_bio = load_conll(f'{dataset_dir}/train.conll')
-    print(f"✅ Loaded {len(train_bio)} BIO-tagged sentences")
-    
-    # Show BIO examples
-    show_bio_examples(train_bio, num_examples=2)
+    if bio_future is not None:
+        print(f"\n📂 Loading CONLL/BIO data...")
+        train_bio = bio_future.result()
+        print(f"✅ Loaded {len(train_bio)} BIO-tagged sentences")
+        
+        # Show BIO examples
+        show_bio_examples(train_bio, num_examples=2)
+        
+        print(f"\n📐 BIO Span Statistics:")
+        for label, span_stats in bio_span_stats(train_bio).items():
+            print(f"   {label}: {span_stats['spans']} spans, {span_stats['avg_length']:.2f} tokens on average")
+    else:
+        print(f"\nℹ️  {conll_path} not found (generated without 'conll' format), skipping BIO examples")
     
     # Extract specific entity types
     print("\n" + "="*60)
     print("🔍 ENTITY EXTRACTION")
     print("="*60)
     
-    addresses = extract_entities_by_type(train_data, 'ADDRESS')
+    entities_by_type = index_entities_by_type(train_data)
+    
+    addresses = sorted(entities_by_type['ADDRESS'])
     print(f"\n📍 Sample Addresses ({min(5, len(addresses))} of {len(addresses)}):")
     for addr in addresses[:5]:
         print(f"   • {addr}")
     
-    sexes = extract_entities_by_type(train_data, 'SEX')
+    sexes = sorted(entities_by_type['SEX'])
     print(f"\n⚧️  Unique Sex/Gender Terms ({len(sexes)}):")
     for sex in sexes:
         print(f"   • {sex}")
@@ -221,10 +676,10 @@ def main():
     print("📋 DATASET STATISTICS")
     print("="*60)
     
-    with open(f'{dataset_dir}/dataset_stats.json', 'r', encoding='utf-8') as f:
-        stats = json.load(f)
-    
-    print(json.dumps(stats, indent=2, ensure_ascii=False))
+    if stats_future is not None:
+        print_json(stats_future.result())
+    else:
+        print(f"ℹ️  {stats_path} not found, skipping statistics")
     
     print("\n" + "="*60)
     print("✅ DEMO COMPLETE!")
@@ -10,11 +10,31 @@ Outputs:
 """
 
 import json
+import multiprocessing
+import os
 import random
+from bisect import bisect_left, bisect_right
+import re
 import csv
-from typing import List, Dict, Tuple
+import string
+import sys
+from collections import Counter
+from contextlib import ExitStack
+from functools import partial
+from typing import Iterator, List, Dict, Tuple
 from faker import Faker
 
+# orjson encodes straight to UTF-8 bytes and is much faster; the stdlib
+# fallback uses the same compact separators so output matches either way
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 # Initialize Faker for multiple locales
 fake_es = Faker('es_ES')  # Spanish
 fake_en = Faker('en_US')  # English
@@ -61,75 +81,166 @@ TEMPLATES_PT = [
     "Segundo o registro, {name} é de gênero {sex} e endereço é {address}.",
 ]
 
+# Tokens are runs of non-separator characters, or single punctuation marks;
+# space, newline and tab only separate
+TOKEN_RE = re.compile(r"""[^ \n\t.,;:!?()\[\]{}"']+|[.,;:!?()\[\]{}"']""")
+
+# Template placeholder -> entity label; labels and language codes are
+# interned so every sample and entity dict shares the same string objects
+SLOT_LABELS = {slot: sys.intern(label) for slot, label in (('name', 'NAME'), ('sex', 'SEX'), ('address', 'ADDRESS'))}
+
+# Entity label -> (B- tag, I- tag), built once instead of per entity
+_BIO = {label: (sys.intern(f'B-{label}'), sys.intern(f'I-{label}')) for label in SLOT_LABELS.values()}
+
+
+def _compile_template(template: str) -> Tuple[str, Tuple[Tuple[str, str, str], ...]]:
+    """
+    Parse a template once into its leading literal and (slot, label, literal) steps
+    
+    The text is head + value(slot) + literal for each step. label is the
+    entity label to record for the slot, or None when the slot is not an
+    entity or its label already appeared earlier in the template.
+    """
+    head, steps = '', []
+    seen_labels = set()
+    for literal, field_name, format_spec, _ in string.Formatter().parse(template):
+        if steps:
+            slot, label, previous = steps[-1]
+            steps[-1] = (slot, label, previous + literal)
+        else:
+            head += literal
+        if field_name is not None:
+            if format_spec:
+                raise ValueError(f"Format specs are not supported in templates: {template!r}")
+            label = SLOT_LABELS.get(field_name)
+            if label in seen_labels:
+                label = None
+            elif label is not None:
+                seen_labels.add(label)
+            steps.append((field_name, label, ''))
+    return head, tuple(steps)
+
+
+def _render(compiled: Tuple[str, Tuple[Tuple[str, str, str], ...]],
+            name: str, sex: str, address: str) -> Tuple[str, List[Dict]]:
+    """
+    Fill a compiled template, recording entity offsets as the text is built
+    
+    Returns:
+        (text, entities) with entities ordered by position
+    """
+    head, steps = compiled
+    values = {'name': name, 'sex': sex, 'address': address}
+    parts = [head]
+    entities = []
+    offset = len(head)
+    for slot, label, literal in steps:
+        value = values[slot]
+        end = offset + len(value)
+        if label is not None:
+            entities.append({
+                'start': offset,
+                'end': end,
+                'label': label,
+                'text': value
+            })
+        parts.append(value)
+        parts.append(literal)
+        offset = end + len(literal)
+    # Entities are appended in template order, so no sort is needed
+    return ''.join(parts), entities
+
+
+# Per-language (templates, genders, name generator, address generator), built
+# once so each sample is a single dict lookup plus bound-method calls
+LANGUAGES = [sys.intern(code) for code in ('es', 'en', 'pt')]
+_COMPILED_TEMPLATES = {
+    template: _compile_template(template)
+    for template in TEMPLATES_ES + TEMPLATES_EN + TEMPLATES_PT
+}
+_LOCALE_TABLE = {
+    language: (templates, GENDERS[language], faker.name, faker.address)
+    for language, faker, templates in (
+        ('es', fake_es, TEMPLATES_ES),
+        ('en', fake_en, TEMPLATES_EN),
+        ('pt', fake_pt, TEMPLATES_PT),
+    )
+}
+_LOCALES = {'es': 'es_ES', 'en': 'en_US', 'pt': 'pt_BR'}
+
+# Optional per-language (names, addresses) pools that samples draw from
+# instead of calling Faker; empty means every sample calls Faker
+_VALUE_POOLS: Dict[str, Tuple[List[str], List[str]]] = {}
+
 
-def generate_sample(language: str = 'es') -> Dict:
+def build_value_pools(pool_size: int) -> Dict[str, Tuple[List[str], List[str]]]:
+    """
+    Generate pool_size Faker names and addresses per language
+    
+    Args:
+        pool_size: Number of names and of addresses per language (0 for none)
+    
+    Returns:
+        Mapping of language code to (names, addresses)
+    """
+    if pool_size <= 0:
+        return {}
+    return {
+        language: (
+            [fake_name() for _ in range(pool_size)],
+            [fake_address().replace('\n', ', ') for _ in range(pool_size)]
+        )
+        for language, (_, _, fake_name, fake_address) in _LOCALE_TABLE.items()
+    }
+
+
+def set_value_pools(pools: Dict[str, Tuple[List[str], List[str]]]):
+    """Install name/address pools for generate_samples (also the worker initializer)"""
+    global _VALUE_POOLS
+    _VALUE_POOLS = pools
+
+
+def generate_sample(
+    language: str = 'es',
+    template: str = None,
+    sex: str = None,
+    name: str = None,
+    address: str = None
+) -> Dict:
     """
     Generate a single training sample with ADDRESS and SEX entities
     
     Args:
         language: 'es' (Spanish), 'en' (English), or 'pt' (Portuguese)
+        template: Pre-drawn template for the language (drawn here if None)
+        sex: Pre-drawn sex/gender term for the language (drawn here if None)
+        name: Pre-drawn name (generated with Faker if None)
+        address: Pre-drawn single-line address (generated with Faker if None)
     
     Returns:
         Dictionary with text and entities in BIO format
     """
-    # Select appropriate faker and templates
-    if language == 'es':
-        faker = fake_es
-        templates = TEMPLATES_ES
-        genders = GENDERS['es']
-    elif language == 'en':
-        faker = fake_en
-        templates = TEMPLATES_EN
-        genders = GENDERS['en']
-    else:  # pt
-        faker = fake_pt
-        templates = TEMPLATES_PT
-        genders = GENDERS['pt']
+    # Select appropriate faker and templates (anything unknown falls back to pt)
+    templates, genders, fake_name, fake_address = _LOCALE_TABLE.get(language, _LOCALE_TABLE['pt'])
     
     # Generate data
-    name = faker.name()
-    sex = random.choice(genders)
-    address = faker.address().replace('\n', ', ')
+    if name is None:
+        name = fake_name()
+    if sex is None:
+        sex = random.choice(genders)
+    if address is None:
+        address = fake_address().replace('\n', ', ')
     
     # Select template and fill it
-    template = random.choice(templates)
-    text = template.format(name=name, sex=sex, address=address)
+    if template is None:
+        template = random.choice(templates)
+    compiled = _COMPILED_TEMPLATES.get(template)
+    if compiled is None:
+        # Custom template: compile it once and reuse it on later calls
+        compiled = _COMPILED_TEMPLATES[template] = _compile_template(template)
     
-    # Find entity positions (simple string matching)
-    entities = []
-    
-    # Find NAME positions (we'll track but focus on ADDRESS and SEX)
-    name_start = text.find(name)
-    if name_start != -1:
-        entities.append({
-            'start': name_start,
-            'end': name_start + len(name),
-            'label': 'NAME',
-            'text': name
-        })
-    
-    # Find SEX positions
-    sex_start = text.find(sex)
-    if sex_start != -1:
-        entities.append({
-            'start': sex_start,
-            'end': sex_start + len(sex),
-            'label': 'SEX',
-            'text': sex
-        })
-    
-    # Find ADDRESS positions
-    address_start = text.find(address)
-    if address_start != -1:
-        entities.append({
-            'start': address_start,
-            'end': address_start + len(address),
-            'label': 'ADDRESS',
-            'text': address
-        })
-    
-    # Sort entities by start position
-    entities.sort(key=lambda x: x['start'])
+    # Entity offsets fall out of building the text, already ordered by position
+    text, entities = _render(compiled, name, sex, address)
     
     return {
         'text': text,
@@ -138,7 +249,47 @@ def generate_sample(language: str = 'es') -> Dict:
     }
 
 
-def convert_to_bio(text: str, entities: List[Dict]) -> List[Tuple[str, str]]:
+def generate_samples(languages: List[str], rng: random.Random = None,
+                     locale_table: Dict = None) -> Iterator[Dict]:
+    """
+    Generate one sample per language code, in order
+    
+    Templates and sex terms are drawn up front with one rng.choices call
+    per language group instead of two random.choice calls per sample. Names
+    and addresses are drawn the same way when value pools are installed
+    (see set_value_pools), otherwise Faker generates them per sample.
+    
+    Args:
+        languages: Language code of each sample to generate
+        rng: Random generator for the draws (default: the global random module)
+        locale_table: Locale table whose Faker methods generate names and
+            addresses (default: the module's shared Faker instances)
+    
+    Yields:
+        Sample dictionaries, as returned by generate_sample
+    """
+    rng = rng or random
+    locale_table = locale_table or _LOCALE_TABLE
+    picks = {}
+    # First-appearance order keeps the draws reproducible for a given seed
+    for language in dict.fromkeys(languages):
+        templates, genders = locale_table.get(language, locale_table['pt'])[:2]
+        count = languages.count(language)
+        draws = [rng.choices(templates, k=count), rng.choices(genders, k=count)]
+        pools = _VALUE_POOLS.get(language)
+        if pools:
+            draws.extend(rng.choices(pool, k=count) for pool in pools)
+        picks[language] = zip(*draws)
+    
+    for language in languages:
+        template, sex, *values = next(picks[language])
+        if not values:
+            fake_name, fake_address = locale_table.get(language, locale_table['pt'])[2:]
+            values = (fake_name(), fake_address().replace('\n', ', '))
+        yield generate_sample(language, template, sex, *values)
+
+
+def convert_to_bio(text: str, entities: List[Dict]) -> Tuple[List[str], List[str]]:
     """
     Convert text and entities to BIO (Beginning, Inside, Outside) format
     
@@ -147,174 +298,316 @@ def convert_to_bio(text: str, entities: List[Dict]) -> List[Tuple[str, str]]:
         entities: List of entity dictionaries
     
     Returns:
-        List of (token, tag) tuples
+        (tokens, tags) as parallel lists
     """
-    # Simple tokenization (split by spaces and punctuation)
-    tokens = []
-    current_token = ""
-    
-    for char in text:
-        if char in ' \n\t.,;:!?()[]{}\"\'':
-            if current_token:
-                tokens.append(current_token)
-                current_token = ""
-            if char.strip():  # Keep punctuation as tokens
-                tokens.append(char)
-        else:
-            current_token += char
+    # Simple tokenization (split by spaces and punctuation) in one regex scan
+    matches = list(TOKEN_RE.finditer(text))
+    tokens = [match.group() for match in matches]
+    token_spans = [match.span() for match in matches]
     
-    if current_token:
-        tokens.append(current_token)
-    
-    # Create character to token mapping
-    char_to_token = []
-    char_index = 0
-    
-    for token_idx, token in enumerate(tokens):
-        token_start = text.find(token, char_index)
-        token_end = token_start + len(token)
-        
-        for i in range(token_start, token_end):
-            char_to_token.append(token_idx)
-        
-        char_index = token_end
+    # Token boundaries, searched with bisect instead of a per-character map
+    token_starts = [start for start, _ in token_spans]
+    token_ends = [end for _, end in token_spans]
     
     # Initialize all tokens as 'O' (Outside)
     bio_tags = ['O'] * len(tokens)
     
     # Assign BIO tags based on entities
     for entity in entities:
-        start_char = entity['start']
-        end_char = entity['end']
         label = entity['label']
+        b_tag, i_tag = _BIO.get(label) or (f'B-{label}', f'I-{label}')
+        
+        # Tokens overlapping the entity: from the first one ending after its
+        # start to the last one starting before its end
+        start_token = bisect_right(token_ends, entity['start'])
+        end_token = bisect_left(token_starts, entity['end']) - 1
         
-        if start_char < len(char_to_token) and end_char <= len(text):
-            # Find token indices
-            start_token = char_to_token[start_char] if start_char < len(char_to_token) else None
-            end_token = char_to_token[end_char - 1] if end_char - 1 < len(char_to_token) else None
+        if start_token <= end_token:
+            # Tag first token as B- (Beginning)
+            bio_tags[start_token] = b_tag
             
-            if start_token is not None and end_token is not None:
-                # Tag first token as B- (Beginning)
-                bio_tags[start_token] = f'B-{label}'
-                
-                # Tag remaining tokens as I- (Inside)
-                for token_idx in range(start_token + 1, end_token + 1):
-                    if token_idx < len(bio_tags):
-                        bio_tags[token_idx] = f'I-{label}'
+            # Tag remaining tokens as I- (Inside); end_token comes from
+            # bisect over the token list, so it is always in range
+            bio_tags[start_token + 1:end_token + 1] = [i_tag] * (end_token - start_token)
     
-    return list(zip(tokens, bio_tags))
+    return tokens, bio_tags
+
+
+CSV_HEADER = ['text', 'language', 'entities_json', 'num_entities']
+
+# Buffer size for output files
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Samples formatted per write when saving a list of samples
+WRITE_BATCH = 1000
+
+
+def _write_jsonl(f, samples: List[Dict]):
+    """Write samples as JSONL lines to a binary file in one write"""
+    f.write(b''.join([_dumps(sample) + b'\n' for sample in samples]))
+
+
+def _write_jsonl_reusing(f, samples: List[Dict], entities_json: List[bytes]):
+    """
+    Write generated samples as JSONL lines around already-serialized entities
+    
+    Only for samples from generate_sample, whose keys are text, entities and
+    language in that order; the bytes match _dumps(sample).
+    """
+    f.write(b''.join([
+        b'{"text":' + _dumps(sample['text']) + b',"entities":' + entities
+        + b',"language":' + _dumps(sample['language']) + b'}\n'
+        for sample, entities in zip(samples, entities_json)
+    ]))
+
+
+def _conll_block(sample: Dict) -> str:
+    """Format one sample as CONLL/BIO token lines followed by a blank line"""
+    tokens, tags = convert_to_bio(sample['text'], sample['entities'])
+    return ''.join([f"{token}\t{tag}\n" for token, tag in zip(tokens, tags)]) + "\n"
+
+
+def _write_conll(f, samples: List[Dict]):
+    """Write samples in CONLL/BIO format in one write"""
+    f.write(''.join([_conll_block(sample) for sample in samples]))
+
+
+def _csv_row(sample: Dict, entities_json: bytes = None) -> List:
+    """Build the CSV row for one sample, reusing its serialized entities if given"""
+    if entities_json is None:
+        entities_json = _dumps(sample['entities'])
+    return [
+        sample['text'],
+        sample['language'],
+        entities_json.decode('utf-8'),
+        len(sample['entities'])
+    ]
+
+
+def _write_csv(writer, samples: List[Dict], entities_json: List[bytes] = None):
+    """Write samples as CSV rows with a single writerows call"""
+    if entities_json is None:
+        writer.writerows(map(_csv_row, samples))
+    else:
+        writer.writerows(map(_csv_row, samples, entities_json))
+
+
+def _save_batches(write, f, samples: List[Dict]):
+    """Pass samples to a batch writer WRITE_BATCH at a time"""
+    for i in range(0, len(samples), WRITE_BATCH):
+        write(f, samples[i:i + WRITE_BATCH])
 
 
 def save_jsonl(samples: List[Dict], filename: str):
     """Save samples in JSONL format (one JSON object per line)"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        for sample in samples:
-            json.dump(sample, f, ensure_ascii=False)
-            f.write('\n')
+    with open(filename, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        _save_batches(_write_jsonl, f, samples)
     print(f"✅ Saved {len(samples)} samples to {filename}")
 
 
 def save_conll(samples: List[Dict], filename: str):
     """Save samples in CONLL/BIO format"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        for sample in samples:
-            bio_tokens = convert_to_bio(sample['text'], sample['entities'])
-            
-            for token, tag in bio_tokens:
-                f.write(f"{token}\t{tag}\n")
-            
-            # Blank line between samples
-            f.write("\n")
+    with open(filename, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        _save_batches(_write_conll, f, samples)
     
     print(f"✅ Saved {len(samples)} samples to {filename} (CONLL format)")
 
 
 def save_csv(samples: List[Dict], filename: str):
     """Save samples in CSV format for inspection"""
-    with open(filename, 'w', encoding='utf-8', newline='') as f:
+    with open(filename, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
         writer = csv.writer(f)
-        writer.writerow(['text', 'language', 'entities_json', 'num_entities'])
-        
-        for sample in samples:
-            writer.writerow([
-                sample['text'],
-                sample['language'],
-                json.dumps(sample['entities'], ensure_ascii=False),
-                len(sample['entities'])
-            ])
+        writer.writerow(CSV_HEADER)
+        _save_batches(_write_csv, writer, samples)
     
     print(f"✅ Saved {len(samples)} samples to {filename}")
 
 
+# Output format -> (name in dataset_stats.json, purpose, note in the save report)
+OUTPUT_FORMATS = {
+    'jsonl': ('JSONL', 'for transformers', ''),
+    'conll': ('CONLL/BIO', 'BIO format', ' (CONLL format)'),
+    'csv': ('CSV', 'for inspection', ''),
+}
+
+
+class SplitWriter:
+    """Open the selected output files for one split and write batches of samples to each"""
+    
+    def __init__(self, stack: ExitStack, output_dir: str, split: str, formats=tuple(OUTPUT_FORMATS)):
+        self.paths = {fmt: f'{output_dir}/{split}.{fmt}' for fmt in OUTPUT_FORMATS if fmt in formats}
+        # Writers are called as writer(samples, entities_json)
+        self.writers = []
+        if 'jsonl' in self.paths:
+            jsonl_file = stack.enter_context(open(self.paths['jsonl'], 'wb', buffering=WRITE_BUFFER_SIZE))
+            if orjson is None and 'csv' in self.paths:
+                # Stdlib json is slow enough that reusing the CSV's entity
+                # JSON pays off; orjson encodes whole samples faster than
+                # the pieces can be stitched together
+                self.writers.append(partial(_write_jsonl_reusing, jsonl_file))
+            else:
+                self.writers.append(lambda samples, _: _write_jsonl(jsonl_file, samples))
+        if 'conll' in self.paths:
+            conll_file = stack.enter_context(
+                open(self.paths['conll'], 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+            )
+            self.writers.append(lambda samples, _: _write_conll(conll_file, samples))
+        if 'csv' in self.paths:
+            csv_file = stack.enter_context(
+                open(self.paths['csv'], 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE)
+            )
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(CSV_HEADER)
+            self.writers.append(partial(_write_csv, csv_writer))
+        self.count = 0
+    
+    def write(self, samples: List[Dict]):
+        # Entities are serialized once for the CSV column and, without
+        # orjson, reused for the JSONL lines
+        entities_json = None
+        if 'csv' in self.paths:
+            entities_json = [_dumps(sample['entities']) for sample in samples]
+        for writer in self.writers:
+            writer(samples, entities_json)
+        self.count += len(samples)
+    
+    def report(self):
+        for fmt, path in self.paths.items():
+            print(f"✅ Saved {self.count} samples to {path}{OUTPUT_FORMATS[fmt][2]}")
+
+
+# Samples generated per seeded task; fixed so the output does not depend on
+# the number of worker processes
+SAMPLES_PER_TASK = 100
+
+# Below this many samples the process pool start-up costs more than it saves.
+# A sample takes ~110us to generate and ~25us to write and unpickle in the
+# main process, so a 4-worker pool saves at most ~100us per sample, while
+# starting the workers (fresh interpreters importing Faker under
+# spawn/forkserver) costs up to ~1s
+PARALLEL_MIN_SAMPLES = 20000
+
+
+# Locale table backed by Faker instances reserved for seeded chunks, built
+# once per process on first use
+_CHUNK_FAKERS: Dict[str, Faker] = {}
+_CHUNK_LOCALE_TABLE: Dict[str, Tuple] = {}
+
+
+def _generate_chunk(task: Tuple[int, List[str]]) -> List[Dict]:
+    """Generate one chunk of samples from its own seed (worker entry point)"""
+    seed, languages = task
+    # Unpickled task strings are fresh copies; map them back to the shared codes
+    languages = [sys.intern(language) for language in languages]
+    if not _CHUNK_LOCALE_TABLE:
+        for language, (templates, genders, _, _) in _LOCALE_TABLE.items():
+            faker = _CHUNK_FAKERS[language] = Faker(_LOCALES[language])
+            _CHUNK_LOCALE_TABLE[language] = (templates, genders, faker.name, faker.address)
+    # A local RNG and instance-seeded Fakers, so generating in this process
+    # leaves the caller's global random/Faker state untouched
+    for faker in _CHUNK_FAKERS.values():
+        faker.seed_instance(seed)
+    return list(generate_samples(languages, random.Random(seed), _CHUNK_LOCALE_TABLE))
+
+
 def generate_dataset(
     num_samples: int = 1000,
     train_ratio: float = 0.8,
-    output_dir: str = 'ner_dataset'
+    output_dir: str = 'ner_dataset',
+    workers: int = None,
+    formats: List[str] = tuple(OUTPUT_FORMATS),
+    pool_size: int = 0
 ):
     """
     Generate complete NER dataset for ADDRESS and SEX detection
     
+    Samples are written to every output file as they are generated, so
+    memory use does not grow with num_samples.
+    
     Args:
         num_samples: Total number of samples to generate
         train_ratio: Ratio of training samples (rest will be validation)
         output_dir: Directory to save output files
+        workers: Number of worker processes (default: all CPU cores,
+            1 generates in this process)
+        formats: Output formats to write, any of 'jsonl', 'conll', 'csv'
+        pool_size: Names and addresses to pre-generate per language and
+            sample from; 0 calls Faker for every sample
     """
-    import os
-    
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
     
+    split_idx = int(num_samples * train_ratio)
     print(f"🚀 Generating {num_samples} samples...")
-    print(f"   Train: {int(num_samples * train_ratio)}")
-    print(f"   Val: {int(num_samples * (1 - train_ratio))}")
-    
-    # Generate samples with language variety
-    all_samples = []
-    languages = ['es', 'en', 'pt']
-    
-    for i in range(num_samples):
-        language = random.choice(languages)
-        sample = generate_sample(language)
-        all_samples.append(sample)
+    print(f"   Train: {split_idx}")
+    print(f"   Val: {num_samples - split_idx}")
+    
+    # Generate samples with language variety (languages drawn in one batch).
+    # Each chunk gets its own seed from the master RNG, so the result is the
+    # same whether chunks run here or in a process pool
+    languages = random.choices(LANGUAGES, k=num_samples)
+    tasks = [
+        (random.getrandbits(64), languages[i:i + SAMPLES_PER_TASK])
+        for i in range(0, num_samples, SAMPLES_PER_TASK)
+    ]
+    split_rng = random.Random(random.getrandbits(64))
+    
+    pools = {}
+    if pool_size > 0:
+        print(f"   Building name/address pools ({pool_size} per language)...")
+        Faker.seed(random.getrandbits(64))
+        pools = build_value_pools(pool_size)
+    set_value_pools(pools)
+    
+    # Sample languages are fixed up front, so their counts are too
+    drawn = Counter(languages)
+    language_counts = {language: drawn[language] for language in LANGUAGES}
+    
+    workers = workers or os.cpu_count() or 1
+    generated = 0
+    
+    with ExitStack() as stack:
+        train_writer = SplitWriter(stack, output_dir, 'train', formats)
+        val_writer = SplitWriter(stack, output_dir, 'val', formats)
         
-        if (i + 1) % 100 == 0:
-            print(f"   Generated {i + 1}/{num_samples} samples...")
-    
-    # Shuffle samples
-    random.shuffle(all_samples)
-    
-    # Split train/val
-    split_idx = int(num_samples * train_ratio)
-    train_samples = all_samples[:split_idx]
-    val_samples = all_samples[split_idx:]
-    
-    print("\n💾 Saving datasets...")
-    
-    # Save in multiple formats
-    # JSONL format
-    save_jsonl(train_samples, f'{output_dir}/train.jsonl')
-    save_jsonl(val_samples, f'{output_dir}/val.jsonl')
-    
-    # CONLL/BIO format
-    save_conll(train_samples, f'{output_dir}/train.conll')
-    save_conll(val_samples, f'{output_dir}/val.conll')
-    
-    # CSV format for inspection
-    save_csv(train_samples, f'{output_dir}/train.csv')
-    save_csv(val_samples, f'{output_dir}/val.csv')
+        if workers > 1 and num_samples >= PARALLEL_MIN_SAMPLES:
+            pool = stack.enter_context(
+                multiprocessing.Pool(workers, initializer=set_value_pools, initargs=(pools,))
+            )
+            # imap keeps task order, so the split stays reproducible
+            chunks = pool.imap(_generate_chunk, tasks)
+        else:
+            chunks = map(_generate_chunk, tasks)
+        
+        train_left = split_idx
+        for chunk in chunks:
+            train_batch, val_batch = [], []
+            for sample in chunk:
+                # Selection sampling: each sample goes to train with
+                # probability (train slots left) / (samples left), which
+                # gives exactly split_idx uniformly chosen train samples
+                if split_rng.random() * (num_samples - generated) < train_left:
+                    train_batch.append(sample)
+                    train_left -= 1
+                else:
+                    val_batch.append(sample)
+                generated += 1
+            train_writer.write(train_batch)
+            val_writer.write(val_batch)
+            print(f"   Generated {generated}/{num_samples} samples...")
+    
+    print("\n💾 Saved datasets:")
+    train_writer.report()
+    val_writer.report()
     
     # Save statistics
     stats = {
         'total_samples': num_samples,
-        'train_samples': len(train_samples),
-        'val_samples': len(val_samples),
-        'languages': {
-            'es': sum(1 for s in all_samples if s['language'] == 'es'),
-            'en': sum(1 for s in all_samples if s['language'] == 'en'),
-            'pt': sum(1 for s in all_samples if s['language'] == 'pt')
-        },
+        'train_samples': train_writer.count,
+        'val_samples': val_writer.count,
+        'languages': language_counts,
         'entity_types': ['ADDRESS', 'SEX', 'NAME'],
-        'formats': ['JSONL', 'CONLL/BIO', 'CSV']
+        'formats': [OUTPUT_FORMATS[fmt][0] for fmt in train_writer.paths]
     }
     
     with open(f'{output_dir}/dataset_stats.json', 'w', encoding='utf-8') as f:
@@ -328,9 +621,8 @@ def generate_dataset(
     print(f"   Languages: ES={stats['languages']['es']}, EN={stats['languages']['en']}, PT={stats['languages']['pt']}")
     print(f"   Entity types: {', '.join(stats['entity_types'])}")
     print(f"\n📁 Files saved in: {output_dir}/")
-    print(f"   - train.jsonl, val.jsonl (for transformers)")
-    print(f"   - train.conll, val.conll (BIO format)")
-    print(f"   - train.csv, val.csv (for inspection)")
+    for fmt in train_writer.paths:
+        print(f"   - train.{fmt}, val.{fmt} ({OUTPUT_FORMATS[fmt][1]})")
     print(f"   - dataset_stats.json (metadata)")
 
 
@@ -365,6 +657,26 @@ def main():
         default=42,
         help='Random seed for reproducibility (default: 42)'
     )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=None,
+        help='Worker processes for sample generation (default: all CPU cores)'
+    )
+    parser.add_argument(
+        '--formats', '-f',
+        nargs='+',
+        choices=list(OUTPUT_FORMATS),
+        default=list(OUTPUT_FORMATS),
+        help='Output formats to write (default: jsonl conll csv)'
+    )
+    parser.add_argument(
+        '--pool-size', '-p',
+        type=int,
+        default=0,
+        help='Pre-generate this many names and addresses per language and sample '
+             'from them; faster for large datasets, less varied (default: 0, Faker per sample)'
+    )
     
     args = parser.parse_args()
     
@@ -376,7 +688,10 @@ def main():
     generate_dataset(
         num_samples=args.num_samples,
         train_ratio=args.train_ratio,
-        output_dir=args.output_dir
+        output_dir=args.output_dir,
+        workers=args.workers,
+        formats=args.formats,
+        pool_size=args.pool_size
     )
     
     print("\n🎯 Next steps:")
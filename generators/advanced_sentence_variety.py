@@ -18,121 +18,322 @@ Date: October 2024
 Purpose: Create challenging training data that prevents overfitting on large datasets
 """
 
+import os
 import random
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
-from enum import Enum
-
-class SentenceLength(Enum):
-    """Sentence length categories"""
-    SHORT = "short"          # 5-8 words
-    MEDIUM = "medium"        # 8-15 words
-    LONG = "long"            # 15-30 words
-    EXTRA_LONG = "extra_long" # 30+ words
-
-class SentenceComplexity(Enum):
-    """Sentence structural complexity"""
-    SIMPLE = "simple"                    # Simple subject-verb-object
-    COMPOUND = "compound"                # Multiple clauses with conjunctions
-    COMPLEX = "complex"                  # Subordinate clauses
-    COMPOUND_COMPLEX = "compound_complex" # Multiple main and subordinate clauses
-
-
-@dataclass
-class SynonymBank:
-    """Comprehensive synonym database for Spanish and Portuguese"""
+import string
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+from typing import Callable, Iterable, Iterator, List, Dict, NamedTuple, Tuple, Optional
+
+import numpy as np
+from enum import IntEnum
+
+class SentenceLength(IntEnum):
+    """Sentence length categories, ordered shortest to longest"""
+    SHORT = 0          # 5-8 words
+    MEDIUM = 1         # 8-15 words
+    LONG = 2           # 15-30 words
+    EXTRA_LONG = 3     # 30+ words
+
+class SentenceComplexity(IntEnum):
+    """Sentence structural complexity, ordered simplest to most complex"""
+    SIMPLE = 0                # Simple subject-verb-object
+    COMPOUND = 1              # Multiple clauses with conjunctions
+    COMPLEX = 2               # Subordinate clauses
+    COMPOUND_COMPLEX = 3      # Multiple main and subordinate clauses
+
+
+# Choices for random lengths/complexities, built once instead of per call
+_ALL_LENGTHS = tuple(SentenceLength)
+_RANDOM_LENGTHS = (SentenceLength.MEDIUM, SentenceLength.LONG, SentenceLength.EXTRA_LONG)
+_RANDOM_COMPLEXITIES = (SentenceComplexity.COMPOUND, SentenceComplexity.COMPLEX,
+                        SentenceComplexity.COMPOUND_COMPLEX)
+
+
+# Synonym pools shared by every generator instance; word lists are immutable
+# tuples, and "connectors" maps each connector type to its pool
+
+# Spanish synonyms - organized by semantic category
+_SPANISH_SYN = {
+    # Verbs - Customer actions
+    "reside": ("habita", "vive", "mora", "domicilia", "radica", "establece su residencia", 
+               "tiene su hogar", "se encuentra ubicado", "fija su domicilio", "permanece"),
+    "registrado": ("inscrito", "anotado", "consignado", "asentado", "documentado", "archivado",
+                  "catalogado", "fichado", "enrolado", "matriculado"),
+    "contacto": ("comunicación", "enlace", "conexión", "vínculo", "relación", "correspondencia",
+                "interacción", "contactación", "nexo", "canal de comunicación"),
+    "identificado": ("reconocido", "determinado", "individualizado", "distinguido", "señalado",
+                    "especificado", "caracterizado", "denominado", "catalogado", "tipificado"),
+    "ubicado": ("situado", "localizado", "emplazado", "posicionado", "establecido", "asentado",
+               "colocado", "dispuesto", "radicado", "instalado"),
     
-    # Spanish synonyms - organized by semantic category
-    SPANISH = {
-        # Verbs - Customer actions
-        "reside": ["habita", "vive", "mora", "domicilia", "radica", "establece su residencia", 
-                   "tiene su hogar", "se encuentra ubicado", "fija su domicilio", "permanece"],
-        "registrado": ["inscrito", "anotado", "consignado", "asentado", "documentado", "archivado",
-                      "catalogado", "fichado", "enrolado", "matriculado"],
-        "contacto": ["comunicación", "enlace", "conexión", "vínculo", "relación", "correspondencia",
-                    "interacción", "contactación", "nexo", "canal de comunicación"],
-        "identificado": ["reconocido", "determinado", "individualizado", "distinguido", "señalado",
-                        "especificado", "caracterizado", "denominado", "catalogado", "tipificado"],
-        "ubicado": ["situado", "localizado", "emplazado", "posicionado", "establecido", "asentado",
-                   "colocado", "dispuesto", "radicado", "instalado"],
-        
-        # Nouns - Business terms
-        "cliente": ["usuario", "consumidor", "comprador", "adquirente", "contratante", "solicitante",
-                   "demandante", "beneficiario", "titular", "suscriptor", "parte interesada", "comprador"],
-        "monto": ["importe", "cantidad", "suma", "valor", "cuantía", "cifra", "total", "montante",
-                 "volumen monetario", "valor económico", "cantidad monetaria", "carga económica"],
-        "dirección": ["domicilio", "residencia", "ubicación", "señas", "lugar de residencia", "vivienda",
-                     "morada", "casa habitación", "lugar", "sede", "emplazamiento", "localización"],
-        "teléfono": ["número telefónico", "línea", "número de contacto", "fono", "celular", "móvil",
-                    "número de teléfono", "línea telefónica", "contacto telefónico", "terminal"],
-        "correo": ["email", "correo electrónico", "e-mail", "dirección electrónica", "casilla electrónica",
-                  "buzón electrónico", "mail", "dirección de correo", "cuenta de correo"],
-        
-        # Adjectives and descriptors
-        "registrado": ["inscrito", "asentado", "consignado", "documentado", "archivado", "anotado"],
-        "oficial": ["formal", "legal", "legítimo", "válido", "autorizado", "certificado", "homologado"],
-        "actual": ["presente", "vigente", "corriente", "contemporáneo", "en curso", "del momento"],
-        "principal": ["primario", "fundamental", "esencial", "primordial", "básico", "central"],
-        
-        # Prepositions and connectors
-        "con": ["que posee", "que cuenta con", "portador de", "teniendo", "en posesión de"],
-        "en": ["dentro de", "al interior de", "ubicado en", "situado en", "establecido en"],
-        "por": ["mediante", "a través de", "por medio de", "utilizando", "con", "vía"],
-        "para": ["destinado a", "con el fin de", "con el propósito de", "orientado a"],
-        
-        # Document/transaction terms
-        "referencia": ["número de referencia", "código", "identificador", "número de serie", "folio",
-                      "número de trámite", "número de expediente", "clave", "número identificador"],
-        "documento": ["documentación", "papel", "certificado", "constancia", "comprobante", "acta",
-                     "cédula", "título", "instrumento", "escritura"],
-        "transacción": ["operación", "movimiento", "gestión", "trámite", "negocio", "procedimiento",
-                       "diligencia", "actuación", "operativo", "proceso"],
-        
-        # Sentence connectors for complex structures
-        "connectors": {
-            "addition": ["además", "asimismo", "también", "igualmente", "de igual manera", "por otra parte"],
-            "contrast": ["sin embargo", "no obstante", "aunque", "a pesar de", "mientras que", "por el contrario"],
-            "cause": ["debido a", "por causa de", "en virtud de", "a razón de", "como consecuencia de"],
-            "sequence": ["posteriormente", "luego", "después", "a continuación", "seguidamente", "subsecuentemente"],
-            "emphasis": ["especialmente", "particularmente", "específicamente", "en particular", "sobre todo"],
-        }
+    # Nouns - Business terms
+    "cliente": ("usuario", "consumidor", "comprador", "adquirente", "contratante", "solicitante",
+               "demandante", "beneficiario", "titular", "suscriptor", "parte interesada", "comprador"),
+    "monto": ("importe", "cantidad", "suma", "valor", "cuantía", "cifra", "total", "montante",
+             "volumen monetario", "valor económico", "cantidad monetaria", "carga económica"),
+    "dirección": ("domicilio", "residencia", "ubicación", "señas", "lugar de residencia", "vivienda",
+                 "morada", "casa habitación", "lugar", "sede", "emplazamiento", "localización"),
+    "teléfono": ("número telefónico", "línea", "número de contacto", "fono", "celular", "móvil",
+                "número de teléfono", "línea telefónica", "contacto telefónico", "terminal"),
+    "correo": ("email", "correo electrónico", "e-mail", "dirección electrónica", "casilla electrónica",
+              "buzón electrónico", "mail", "dirección de correo", "cuenta de correo"),
+    
+    # Adjectives and descriptors ("registrado" is listed with the verbs above)
+    "oficial": ("formal", "legal", "legítimo", "válido", "autorizado", "certificado", "homologado"),
+    "actual": ("presente", "vigente", "corriente", "contemporáneo", "en curso", "del momento"),
+    "principal": ("primario", "fundamental", "esencial", "primordial", "básico", "central"),
+    
+    # Prepositions and connectors
+    "con": ("que posee", "que cuenta con", "portador de", "teniendo", "en posesión de"),
+    "en": ("dentro de", "al interior de", "ubicado en", "situado en", "establecido en"),
+    "por": ("mediante", "a través de", "por medio de", "utilizando", "con", "vía"),
+    "para": ("destinado a", "con el fin de", "con el propósito de", "orientado a"),
+    
+    # Document/transaction terms
+    "referencia": ("número de referencia", "código", "identificador", "número de serie", "folio",
+                  "número de trámite", "número de expediente", "clave", "número identificador"),
+    "documento": ("documentación", "papel", "certificado", "constancia", "comprobante", "acta",
+                 "cédula", "título", "instrumento", "escritura"),
+    "transacción": ("operación", "movimiento", "gestión", "trámite", "negocio", "procedimiento",
+                   "diligencia", "actuación", "operativo", "proceso"),
+    
+    # Sentence connectors for complex structures
+    "connectors": {
+        "addition": ("además", "asimismo", "también", "igualmente", "de igual manera", "por otra parte"),
+        "contrast": ("sin embargo", "no obstante", "aunque", "a pesar de", "mientras que", "por el contrario"),
+        "cause": ("debido a", "por causa de", "en virtud de", "a razón de", "como consecuencia de"),
+        "sequence": ("posteriormente", "luego", "después", "a continuación", "seguidamente", "subsecuentemente"),
+        "emphasis": ("especialmente", "particularmente", "específicamente", "en particular", "sobre todo"),
     }
+}
+
+# Portuguese synonyms
+_PORTUGUESE_SYN = {
+    # Verbos - ações do cliente
+    "reside": ("habita", "mora", "domicilia", "estabelece residência", "tem endereço",
+              "está localizado", "fixa domicílio", "permanece"),
+    "registrado": ("inscrito", "cadastrado", "documentado", "arquivado", "catalogado",
+                  "fichado", "matriculado", "anotado"),
+    "identificado": ("reconhecido", "determinado", "individualizado", "distinguido",
+                    "especificado", "caracterizado", "denominado"),
+    "localizado": ("situado", "posicionado", "estabelecido", "instalado", "colocado",
+                  "disposto", "fixado"),
     
-    # Portuguese synonyms
-    PORTUGUESE = {
-        # Verbos - ações do cliente
-        "reside": ["habita", "mora", "domicilia", "estabelece residência", "tem endereço",
-                  "está localizado", "fixa domicílio", "permanece"],
-        "registrado": ["inscrito", "cadastrado", "documentado", "arquivado", "catalogado",
-                      "fichado", "matriculado", "anotado"],
-        "identificado": ["reconhecido", "determinado", "individualizado", "distinguido",
-                        "especificado", "caracterizado", "denominado"],
-        "localizado": ["situado", "posicionado", "estabelecido", "instalado", "colocado",
-                      "disposto", "fixado"],
-        
-        # Substantivos - termos comerciais
-        "cliente": ["usuário", "consumidor", "comprador", "adquirente", "contratante",
-                   "solicitante", "beneficiário", "titular", "assinante"],
-        "valor": ["quantia", "soma", "montante", "total", "cifra", "valor monetário",
-                 "volume financeiro", "carga financeira"],
-        "endereço": ["domicílio", "residência", "localização", "morada", "lugar",
-                    "sede", "localidade", "paradeiro"],
-        "telefone": ["número telefônico", "linha", "contato", "celular", "móvel",
-                    "número de contato", "linha telefônica"],
-        "email": ["correio eletrônico", "e-mail", "endereço eletrônico", "caixa postal eletrônica",
-                 "correio", "endereço de email"],
-        
-        # Conectores de sentenças complexas
-        "connectors": {
-            "addition": ["além disso", "também", "igualmente", "da mesma forma", "por outro lado"],
-            "contrast": ["porém", "contudo", "entretanto", "apesar de", "enquanto", "ao contrário"],
-            "cause": ["devido a", "por causa de", "em virtude de", "como consequência de"],
-            "sequence": ["posteriormente", "depois", "em seguida", "logo após", "subsequentemente"],
-            "emphasis": ["especialmente", "particularmente", "especificamente", "sobretudo"],
-        }
+    # Substantivos - termos comerciais
+    "cliente": ("usuário", "consumidor", "comprador", "adquirente", "contratante",
+               "solicitante", "beneficiário", "titular", "assinante"),
+    "valor": ("quantia", "soma", "montante", "total", "cifra", "valor monetário",
+             "volume financeiro", "carga financeira"),
+    "endereço": ("domicílio", "residência", "localização", "morada", "lugar",
+                "sede", "localidade", "paradeiro"),
+    "telefone": ("número telefônico", "linha", "contato", "celular", "móvel",
+                "número de contato", "linha telefônica"),
+    "email": ("correio eletrônico", "e-mail", "endereço eletrônico", "caixa postal eletrônica",
+             "correio", "endereço de email"),
+    
+    # Conectores de sentenças complexas
+    "connectors": {
+        "addition": ("além disso", "também", "igualmente", "da mesma forma", "por outro lado"),
+        "contrast": ("porém", "contudo", "entretanto", "apesar de", "enquanto", "ao contrário"),
+        "cause": ("devido a", "por causa de", "em virtude de", "como consequência de"),
+        "sequence": ("posteriormente", "depois", "em seguida", "logo após", "subsequentemente"),
+        "emphasis": ("especialmente", "particularmente", "especificamente", "sobretudo"),
+    }
+}
+
+
+
+def _intern_pools(bank: Dict) -> Dict:
+    """Intern every word of a synonym bank, connector pools included."""
+    return {
+        key: _intern_pools(pool) if isinstance(pool, dict) else tuple(sys.intern(word) for word in pool)
+        for key, pool in bank.items()
     }
 
 
+# One shared string object per synonym, so generated sentences and any
+# downstream token hashing/comparison reuse them
+_SPANISH_SYN = _intern_pools(_SPANISH_SYN)
+_PORTUGUESE_SYN = _intern_pools(_PORTUGUESE_SYN)
+
+
+class SynonymBank:
+    """Comprehensive synonym database for Spanish and Portuguese"""
+    
+    SPANISH = _SPANISH_SYN
+    PORTUGUESE = _PORTUGUESE_SYN
+
+
+# Sentence templates. Placeholders are PII fields ({name}, {id}, ...),
+# synonyms ({syn:word}, drawn with get_synonym) and connectors
+# ({conn:type}, drawn with get_connector); they are compiled once below into
+# literal parts plus fill positions so only the chosen template is rendered
+LONG_TEMPLATES_CHILE = [
+    # Compound-complex with relative clause
+    "El {syn:cliente} {name}, {syn:identificado} con RUT {id}, "
+    "{syn:reside} en {address}, {city}, "
+    "{conn:addition} puede ser {syn:contacto} mediante el {syn:teléfono} {phone} "
+    "o a través del {syn:correo} {email}, habiendo realizado una {syn:transacción} "
+    "por un {syn:monto} de {amount} bajo el número de {syn:referencia} {ref}.",
+
+    # Complex with causal subordinate clause
+    "Debido a que el {syn:usuario} {name} (RUT: {id}) "
+    "{syn:ubicado} en la {syn:dirección} {address}, sector {city}, "
+    "solicitó información, se establece {syn:contacto} telefónico al {phone} "
+    "y {syn:correo} al {email}, {conn:sequence} procesando el pago de {amount} "
+    "con el folio {ref}.",
+
+    # Compound-complex with conditional
+    "Si el {syn:contratante} {name}, quien posee el documento {id} "
+    "y {syn:domicilia} en {address}, comuna de {city}, "
+    "requiere {conn:emphasis} asistencia, debe comunicarse al {syn:número telefónico} {phone} "
+    "o enviar un mensaje al {email}, considerando que su operación por {amount} "
+    "está {syn:registrado} con el código {ref}.",
+
+    # Long descriptive with multiple subordinate clauses
+    "Según los registros oficiales, el {syn:beneficiario} {name}, "
+    "cuyo número de identificación corresponde al RUT {id}, "
+    "mantiene su {syn:residencia} {syn:oficial} en {address}, "
+    "específicamente en la localidad de {city}, siendo sus datos de {syn:contacto} "
+    "el teléfono {phone} junto con el {syn:correo electrónico} {email}, "
+    "{conn:addition} habiendo efectuado un movimiento económico de {amount} "
+    "que se encuentra {syn:documentado} bajo el número de serie {ref}.",
+
+    # Narrative style with sequence
+    "En primera instancia, se verificó que el {syn:titular} {name} "
+    "portando la cédula de identidad {id}, {syn:establecido} en el {syn:domicilio} {address}, "
+    "perteneciente a la ciudad de {city}, {conn:sequence} se procedió a establecer "
+    "comunicación telefónica al número {phone}, {conn:addition} confirmando la dirección de "
+    "{syn:correo} {email}, para finalmente validar la {syn:transacción} "
+    "económica de {amount} {syn:registrado} con el {syn:identificador} {ref}.",
+
+    # Formal bureaucratic style
+    "Por medio del presente, se hace constar que el {syn:solicitante} {name}, "
+    "{syn:identificado} legalmente mediante el RUT número {id}, "
+    "quien fija su {syn:lugar de residencia} en {address}, correspondiente a {city}, "
+    "puede ser {syn:contacto} a través del {syn:terminal} telefónico {phone} "
+    "o mediante {syn:correo electrónico} enviado a {email}, "
+    "{conn:emphasis} habiendo realizado un desembolso monetario por {amount} "
+    "el cual se encuentra debidamente {syn:asentado} bajo el folio número {ref}.",
+
+    # Conversational-formal hybrid
+    "Le informamos que el {syn:comprador} {name}, {syn:reconocido} por su RUT {id}, "
+    "quien actualmente {syn:habita} en la {syn:ubicación} {address} "
+    "dentro del sector {city}, {conn:contrast} puede recibir notificaciones "
+    "tanto en el {syn:número de teléfono} {phone} como en el {syn:buzón electrónico} {email}, "
+    "considerando {conn:emphasis} que mantiene una {syn:operación} pendiente "
+    "por el {syn:valor} de {amount} con número de {syn:expediente} {ref}.",
+
+    # Technical-administrative style
+    "Los antecedentes del {syn:usuario} {name} indican que su documento de identidad RUT {id} "
+    "se encuentra {syn:vinculado} al {syn:domicilio} {syn:registrado} en {address}, "
+    "jurisdicción de {city}, {conn:addition} existiendo canales de {syn:comunicación} "
+    "habilitados en el {syn:contacto telefónico} {phone} así como en la {syn:dirección electrónica} {email}, "
+    "{conn:sequence} procesándose {syn:actualmente} un {syn:movimiento} financiero "
+    "de {amount} {syn:catalogado} con el {syn:código} {ref}.",
+]
+
+MEDIUM_TEMPLATES_CHILE = [
+    "El {syn:cliente} {name} con RUT {id} {syn:reside} en {address}, {city}.",
+
+    "{syn:Registrado} {name} ({id}) {syn:ubicado} en {address}, contacto: {phone}.",
+
+    "{syn:Usuario} {name}, RUT {id}, {syn:domicilia} {address}, {city}, fono {phone}.",
+
+    "El {syn:titular} {name} (identificación {id}) {syn:establece residencia} en {address}.",
+
+    "{name}, con {syn:documento} {id}, {syn:localizado} en {address}, {syn:correo}: {email}.",
+
+    "El {syn:contratante} {name} posee RUT {id}, {syn:dirección}: {address}, {city}.",
+
+    "{syn:Beneficiario} {name}, cédula {id}, {syn:residencia}: {address}, tel: {phone}.",
+
+    "Datos: {name} (RUT: {id}), {syn:domicilio}: {address}, {syn:móvil}: {phone}.",
+
+    "{syn:Comprador} {name}, documento {id}, {syn:morada}: {address}, email: {email}.",
+
+    "El {syn:adquirente} {name} con identificación {id} {syn:fija domicilio} en {address}.",
+
+    "{name}, {syn:portador} de RUT {id}, {syn:situado} en {address}, ciudad {city}.",
+
+    "El {syn:suscriptor} {name}, RUT {id}, mantiene {syn:ubicación} en {address}.",
+
+    "{syn:Solicitante}: {name}, identificación: {id}, {syn:lugar}: {address}, contacto: {phone}.",
+
+    "Información de {name} ({id}), {syn:establecido} en {address}, {city}.",
+
+    "{name} con {syn:cédula} {id}, {syn:permanece} en {address}, teléfono {phone}.",
+]
+
+
+# Sentence for countries without templates of their own
+_FALLBACK_TPL = "Cliente {name} con ID {id} reside en {address}."
+
+
+class CompiledTemplate(NamedTuple):
+    """Sentence template as literal parts with the positions to fill in"""
+    parts: Tuple[str, ...]                          # literal text, "" at each slot/PII position
+    pii: Tuple[Tuple[int, str], ...]                # (position, PII field)
+    slots: Tuple[Tuple[int, Tuple[str, str]], ...]  # (position, ("syn", word) or ("conn", type))
+
+
+def _compile_template(template: str) -> CompiledTemplate:
+    """
+    Split a sentence template into literal parts and the positions to fill.
+    
+    Args:
+        template (str): Template using {field}, {syn:word} and {conn:type} placeholders
+        
+    Returns:
+        CompiledTemplate: Parts to copy and fill, then join
+    """
+    parts, pii, slots = [], [], []
+    for literal, field_name, spec, _ in string.Formatter().parse(template):
+        if literal:
+            parts.append(literal)
+        if field_name is None:
+            continue
+        if field_name in ("syn", "conn"):
+            slots.append((len(parts), (field_name, spec)))
+        else:
+            pii.append((len(parts), field_name))
+        parts.append("")
+    return CompiledTemplate(tuple(parts), tuple(pii), tuple(slots))
+
+
+def _assemble_batch(templates: Iterable[CompiledTemplate], pii_data_list: List[Dict],
+                    words: Dict[Tuple[str, str], Iterator[str]]) -> List[str]:
+    """
+    Render a batch of compiled templates with pre-drawn slot words.
+    
+    Fills each template like AdvancedSentenceGenerator._render, but takes
+    slot words from the batch preflight draws, with the loop kept free of
+    method calls and attribute lookups.
+    
+    Args:
+        templates (Iterable[CompiledTemplate]): Template per sentence
+        pii_data_list (List[Dict]): PII data per sentence
+        words: Pre-drawn words per (kind, value) slot
+        
+    Returns:
+        List[str]: Rendered sentences
+    """
+    join, text, draw = "".join, str, next
+    sentences = []
+    append = sentences.append
+    for (template_parts, pii, slots), pii_data in zip(templates, pii_data_list):
+        parts = list(template_parts)
+        for position, field in pii:
+            parts[position] = text(pii_data[field])
+        for position, slot in slots:
+            parts[position] = draw(words[slot])
+        append(join(parts))
+    return sentences
+
+
 class AdvancedSentenceGenerator:
     """
     Advanced sentence generator with maximum variety and complexity.
@@ -141,22 +342,70 @@ class AdvancedSentenceGenerator:
     to prevent model memorization in large training sets (200K+).
     """
     
-    def __init__(self, language: str = "es"):
+    _LONG_TEMPLATES_CL = tuple(_compile_template(t) for t in LONG_TEMPLATES_CHILE)
+    _MEDIUM_TEMPLATES_CL = tuple(_compile_template(t) for t in MEDIUM_TEMPLATES_CHILE)
+    
+    def __init__(self, language: str = "es", skeletons_per_template: int = 0,
+                 synonym_palette: int = 0, seed: Optional[int] = None):
         """
         Initialize the advanced sentence generator.
         
         Args:
             language (str): Language code ("es" for Spanish, "pt" for Portuguese)
+            skeletons_per_template (int): If > 0, pre-render this many variants of
+                each Chile template with synonyms and connectors already drawn, so
+                generation only fills in PII. Much faster, but limits variety
+                to that fixed palette (default 0: draw words for every sentence)
+            synonym_palette (int): If > 0, cut each synonym/connector pool down to
+                this many pre-drawn words, which single sentences take in rotation
+                instead of drawing at random (batches draw from the palettes).
+                Cheaper per word, but limits each template to about that many
+                word combinations (default 0: full pools)
+            seed (int): Seed for self.random. Skeletons and palettes are drawn
+                here in the constructor, so pass a seed (rather than seeding
+                self.random afterwards) to make them reproducible
         """
         self.language = language
-        self.synonym_bank = SynonymBank()
-        self.random = random.Random()
+        self.random = random.Random(seed)
         
-        # Load appropriate synonym dictionary
-        if language == "pt":
-            self.synonyms = self.synonym_bank.PORTUGUESE
-        else:
-            self.synonyms = self.synonym_bank.SPANISH
+        # Load appropriate synonym dictionary (module-level, shared)
+        self.synonyms = _PORTUGUESE_SYN if language == "pt" else _SPANISH_SYN
+        
+        # Palette per (kind, value) slot and the rotation counter; palettes are
+        # drawn from self.random when the skeletons/renderers below are built
+        self._palette_size = synonym_palette
+        self._palettes = {}
+        self._rotation = 0
+        
+        self._long_skeletons = self._build_skeletons(self._LONG_TEMPLATES_CL, skeletons_per_template)
+        self._medium_skeletons = self._build_skeletons(self._MEDIUM_TEMPLATES_CL, skeletons_per_template)
+        self._build_renderers()
+        
+        # Sentence generator per country and length; add other countries here
+        self._generators = {
+            "chile": {
+                SentenceLength.SHORT: self.generate_medium_sentence_chile,
+                SentenceLength.MEDIUM: self.generate_medium_sentence_chile,
+                SentenceLength.LONG: self.generate_long_sentence_chile,
+                SentenceLength.EXTRA_LONG: self.generate_long_sentence_chile,
+            },
+        }
+    
+    def __getstate__(self) -> Dict:
+        """Pickle state without the exec-built renderers (sent to pool workers)"""
+        state = self.__dict__.copy()
+        del state["_long_renderers"], state["_medium_renderers"]
+        return state
+    
+    def __setstate__(self, state: Dict) -> None:
+        """Restore pickled state and rebuild the renderers"""
+        self.__dict__.update(state)
+        self._build_renderers()
+    
+    def _build_renderers(self) -> None:
+        """Specialize every Chile template for self.synonyms (call again after replacing it)"""
+        self._long_renderers = tuple(self._specialize(t) for t in self._LONG_TEMPLATES_CL)
+        self._medium_renderers = tuple(self._specialize(t) for t in self._MEDIUM_TEMPLATES_CL)
     
     def get_synonym(self, word: str, context: Optional[str] = None) -> str:
         """
@@ -169,9 +418,11 @@ class AdvancedSentenceGenerator:
         Returns:
             str: Synonym or original word if no synonym exists
         """
-        word_lower = word.lower()
-        if word_lower in self.synonyms:
-            synonyms = self.synonyms[word_lower]
+        if self._palette_size:
+            palette = self._slot_pool("syn", word)
+            return self._rotate(palette) if palette else word
+        synonyms = self.synonyms.get(word.lower())
+        if synonyms:
             return self.random.choice(synonyms)
         return word
     
@@ -185,10 +436,142 @@ class AdvancedSentenceGenerator:
         Returns:
             str: Random connector
         """
+        if self._palette_size:
+            palette = self._slot_pool("conn", connector_type)
+            return self._rotate(palette) if palette else ""
         if "connectors" in self.synonyms and connector_type in self.synonyms["connectors"]:
             return self.random.choice(self.synonyms["connectors"][connector_type])
         return ""
     
+    def _slot_pool(self, kind: str, value: str) -> Optional[List[str]]:
+        """
+        Get the words a synonym or connector slot draws from.
+        
+        Args:
+            kind (str): "syn" or "conn"
+            value (str): Word or connector type of the slot
+            
+        Returns:
+            Optional[List[str]]: Candidate words (the slot's palette when
+            synonym_palette is set), or None when the slot has a fixed value
+            (the word itself, or "" for an unknown connector)
+        """
+        if kind == "syn":
+            value = value.lower()
+            pool = self.synonyms.get(value)
+        else:
+            pool = self.synonyms.get("connectors", {}).get(value)
+        if not pool or self._palette_size <= 0:
+            return pool
+        
+        palette = self._palettes.get((kind, value))
+        if palette is None:
+            choice = self.random.choice
+            palette = tuple(choice(pool) for _ in range(self._palette_size))
+            self._palettes[kind, value] = palette
+        return palette
+    
+    def _rotate(self, palette: Tuple[str, ...]) -> str:
+        """
+        Take the next word from a palette, cycling through it.
+        
+        One counter is shared by all palettes, so the same word does not get
+        the same pick in consecutive sentences.
+        
+        Args:
+            palette (Tuple[str, ...]): Palette from _slot_pool
+            
+        Returns:
+            str: Picked word
+        """
+        self._rotation += 1
+        return palette[self._rotation % len(palette)]
+    
+    def _specialize(self, template: CompiledTemplate) -> Callable[[Dict, Callable], str]:
+        """
+        Generate and compile a function rendering one template.
+        
+        The function joins the template's literals, PII fields and slot draws
+        in one straight-line expression, with each slot's synonym or
+        connector pool bound as a default argument. Rendering then does no
+        synonym-bank lookups, and draws the same words in the same order as
+        _render.
+        
+        Args:
+            template (CompiledTemplate): Template from _compile_template
+            
+        Returns:
+            Callable: render(pii_data, choice) -> str, where choice draws one
+            word from a pool (self.random.choice)
+        """
+        pii, slots = dict(template.pii), dict(template.slots)
+        namespace, pools, pieces = {}, [], []
+        for position, literal in enumerate(template.parts):
+            if position in pii:
+                pieces.append(f"str(pii_data[{pii[position]!r}])")
+            elif position in slots:
+                kind, value = slots[position]
+                pool = self._slot_pool(kind, value)
+                if pool:
+                    name = f"_pool{len(pools)}"
+                    namespace[name] = pool
+                    pools.append(name)
+                    pieces.append(f"choice({name})")
+                else:
+                    pieces.append(repr(value if kind == "syn" else ""))
+            else:
+                pieces.append(repr(literal))
+        
+        params = "".join(f", {name}={name}" for name in pools)
+        source = (
+            f"def render(pii_data, choice{params}):\n"
+            f"    return ''.join(({', '.join(pieces)},))\n"
+        )
+        exec(compile(source, "<sentence template>", "exec"), namespace)
+        return namespace["render"]
+    
+    def _render(self, template: CompiledTemplate, pii_data: Dict) -> str:
+        """
+        Fill a compiled template, drawing synonyms and connectors for its slots only.
+        
+        Args:
+            template (CompiledTemplate): Template from _compile_template
+            pii_data (Dict): Dictionary containing PII placeholders
+            
+        Returns:
+            str: Rendered sentence
+        """
+        parts = list(template.parts)
+        for position, field in template.pii:
+            parts[position] = str(pii_data[field])
+        # Bound once per render instead of once per slot
+        get_synonym, get_connector = self.get_synonym, self.get_connector
+        for position, (kind, value) in template.slots:
+            parts[position] = get_synonym(value) if kind == "syn" else get_connector(value)
+        return "".join(parts)
+    
+    def _build_skeletons(self, templates: Tuple[CompiledTemplate, ...], count: int) -> List[CompiledTemplate]:
+        """
+        Pre-render templates with their synonym and connector slots filled in.
+        
+        Args:
+            templates: Compiled templates
+            count (int): Variants to render per template
+            
+        Returns:
+            List[CompiledTemplate]: count skeletons per template, with only PII
+            left to fill (empty when count <= 0)
+        """
+        skeletons = []
+        get_synonym, get_connector = self.get_synonym, self.get_connector
+        for template in templates:
+            for _ in range(count):
+                parts = list(template.parts)
+                for position, (kind, value) in template.slots:
+                    parts[position] = get_synonym(value) if kind == "syn" else get_connector(value)
+                skeletons.append(CompiledTemplate(tuple(parts), template.pii, ()))
+        return skeletons
+    
     def generate_long_sentence_chile(self, pii_data: Dict) -> str:
         """
         Generate a long, complex sentence (15-30 words) for Chile.
@@ -202,72 +585,10 @@ class AdvancedSentenceGenerator:
         Returns:
             str: Complex sentence with high variety
         """
-        templates = [
-            # Compound-complex with relative clause
-            f"El {self.get_synonym('cliente')} {pii_data['name']}, {self.get_synonym('identificado')} con RUT {pii_data['id']}, "
-            f"{self.get_synonym('reside')} en {pii_data['address']}, {pii_data['city']}, "
-            f"{self.get_connector('addition')} puede ser {self.get_synonym('contacto')} mediante el {self.get_synonym('teléfono')} {pii_data['phone']} "
-            f"o a través del {self.get_synonym('correo')} {pii_data['email']}, habiendo realizado una {self.get_synonym('transacción')} "
-            f"por un {self.get_synonym('monto')} de {pii_data['amount']} bajo el número de {self.get_synonym('referencia')} {pii_data['ref']}.",
-            
-            # Complex with causal subordinate clause
-            f"Debido a que el {self.get_synonym('usuario')} {pii_data['name']} (RUT: {pii_data['id']}) "
-            f"{self.get_synonym('ubicado')} en la {self.get_synonym('dirección')} {pii_data['address']}, sector {pii_data['city']}, "
-            f"solicitó información, se establece {self.get_synonym('contacto')} telefónico al {pii_data['phone']} "
-            f"y {self.get_synonym('correo')} al {pii_data['email']}, {self.get_connector('sequence')} procesando el pago de {pii_data['amount']} "
-            f"con el folio {pii_data['ref']}.",
-            
-            # Compound-complex with conditional
-            f"Si el {self.get_synonym('contratante')} {pii_data['name']}, quien posee el documento {pii_data['id']} "
-            f"y {self.get_synonym('domicilia')} en {pii_data['address']}, comuna de {pii_data['city']}, "
-            f"requiere {self.get_connector('emphasis')} asistencia, debe comunicarse al {self.get_synonym('número telefónico')} {pii_data['phone']} "
-            f"o enviar un mensaje al {pii_data['email']}, considerando que su operación por {pii_data['amount']} "
-            f"está {self.get_synonym('registrado')} con el código {pii_data['ref']}.",
-            
-            # Long descriptive with multiple subordinate clauses
-            f"Según los registros oficiales, el {self.get_synonym('beneficiario')} {pii_data['name']}, "
-            f"cuyo número de identificación corresponde al RUT {pii_data['id']}, "
-            f"mantiene su {self.get_synonym('residencia')} {self.get_synonym('oficial')} en {pii_data['address']}, "
-            f"específicamente en la localidad de {pii_data['city']}, siendo sus datos de {self.get_synonym('contacto')} "
-            f"el teléfono {pii_data['phone']} junto con el {self.get_synonym('correo electrónico')} {pii_data['email']}, "
-            f"{self.get_connector('addition')} habiendo efectuado un movimiento económico de {pii_data['amount']} "
-            f"que se encuentra {self.get_synonym('documentado')} bajo el número de serie {pii_data['ref']}.",
-            
-            # Narrative style with sequence
-            f"En primera instancia, se verificó que el {self.get_synonym('titular')} {pii_data['name']} "
-            f"portando la cédula de identidad {pii_data['id']}, {self.get_synonym('establecido')} en el {self.get_synonym('domicilio')} {pii_data['address']}, "
-            f"perteneciente a la ciudad de {pii_data['city']}, {self.get_connector('sequence')} se procedió a establecer "
-            f"comunicación telefónica al número {pii_data['phone']}, {self.get_connector('addition')} confirmando la dirección de "
-            f"{self.get_synonym('correo')} {pii_data['email']}, para finalmente validar la {self.get_synonym('transacción')} "
-            f"económica de {pii_data['amount']} {self.get_synonym('registrado')} con el {self.get_synonym('identificador')} {pii_data['ref']}.",
-            
-            # Formal bureaucratic style
-            f"Por medio del presente, se hace constar que el {self.get_synonym('solicitante')} {pii_data['name']}, "
-            f"{self.get_synonym('identificado')} legalmente mediante el RUT número {pii_data['id']}, "
-            f"quien fija su {self.get_synonym('lugar de residencia')} en {pii_data['address']}, correspondiente a {pii_data['city']}, "
-            f"puede ser {self.get_synonym('contacto')} a través del {self.get_synonym('terminal')} telefónico {pii_data['phone']} "
-            f"o mediante {self.get_synonym('correo electrónico')} enviado a {pii_data['email']}, "
-            f"{self.get_connector('emphasis')} habiendo realizado un desembolso monetario por {pii_data['amount']} "
-            f"el cual se encuentra debidamente {self.get_synonym('asentado')} bajo el folio número {pii_data['ref']}.",
-            
-            # Conversational-formal hybrid
-            f"Le informamos que el {self.get_synonym('comprador')} {pii_data['name']}, {self.get_synonym('reconocido')} por su RUT {pii_data['id']}, "
-            f"quien actualmente {self.get_synonym('habita')} en la {self.get_synonym('ubicación')} {pii_data['address']} "
-            f"dentro del sector {pii_data['city']}, {self.get_connector('contrast')} puede recibir notificaciones "
-            f"tanto en el {self.get_synonym('número de teléfono')} {pii_data['phone']} como en el {self.get_synonym('buzón electrónico')} {pii_data['email']}, "
-            f"considerando {self.get_connector('emphasis')} que mantiene una {self.get_synonym('operación')} pendiente "
-            f"por el {self.get_synonym('valor')} de {pii_data['amount']} con número de {self.get_synonym('expediente')} {pii_data['ref']}.",
-            
-            # Technical-administrative style
-            f"Los antecedentes del {self.get_synonym('usuario')} {pii_data['name']} indican que su documento de identidad RUT {pii_data['id']} "
-            f"se encuentra {self.get_synonym('vinculado')} al {self.get_synonym('domicilio')} {self.get_synonym('registrado')} en {pii_data['address']}, "
-            f"jurisdicción de {pii_data['city']}, {self.get_connector('addition')} existiendo canales de {self.get_synonym('comunicación')} "
-            f"habilitados en el {self.get_synonym('contacto telefónico')} {pii_data['phone']} así como en la {self.get_synonym('dirección electrónica')} {pii_data['email']}, "
-            f"{self.get_connector('sequence')} procesándose {self.get_synonym('actualmente')} un {self.get_synonym('movimiento')} financiero "
-            f"de {pii_data['amount']} {self.get_synonym('catalogado')} con el {self.get_synonym('código')} {pii_data['ref']}.",
-        ]
-        
-        return self.random.choice(templates)
+        if self._long_skeletons:
+            return self._render(self.random.choice(self._long_skeletons), pii_data)
+        choice = self.random.choice
+        return choice(self._long_renderers)(pii_data, self._rotate if self._palette_size else choice)
     
     def generate_medium_sentence_chile(self, pii_data: Dict) -> str:
         """
@@ -279,39 +600,10 @@ class AdvancedSentenceGenerator:
         Returns:
             str: Medium sentence with varied vocabulary
         """
-        templates = [
-            f"El {self.get_synonym('cliente')} {pii_data['name']} con RUT {pii_data['id']} {self.get_synonym('reside')} en {pii_data['address']}, {pii_data['city']}.",
-            
-            f"{self.get_synonym('Registrado')} {pii_data['name']} ({pii_data['id']}) {self.get_synonym('ubicado')} en {pii_data['address']}, contacto: {pii_data['phone']}.",
-            
-            f"{self.get_synonym('Usuario')} {pii_data['name']}, RUT {pii_data['id']}, {self.get_synonym('domicilia')} {pii_data['address']}, {pii_data['city']}, fono {pii_data['phone']}.",
-            
-            f"El {self.get_synonym('titular')} {pii_data['name']} (identificación {pii_data['id']}) {self.get_synonym('establece residencia')} en {pii_data['address']}.",
-            
-            f"{pii_data['name']}, con {self.get_synonym('documento')} {pii_data['id']}, {self.get_synonym('localizado')} en {pii_data['address']}, {self.get_synonym('correo')}: {pii_data['email']}.",
-            
-            f"El {self.get_synonym('contratante')} {pii_data['name']} posee RUT {pii_data['id']}, {self.get_synonym('dirección')}: {pii_data['address']}, {pii_data['city']}.",
-            
-            f"{self.get_synonym('Beneficiario')} {pii_data['name']}, cédula {pii_data['id']}, {self.get_synonym('residencia')}: {pii_data['address']}, tel: {pii_data['phone']}.",
-            
-            f"Datos: {pii_data['name']} (RUT: {pii_data['id']}), {self.get_synonym('domicilio')}: {pii_data['address']}, {self.get_synonym('móvil')}: {pii_data['phone']}.",
-            
-            f"{self.get_synonym('Comprador')} {pii_data['name']}, documento {pii_data['id']}, {self.get_synonym('morada')}: {pii_data['address']}, email: {pii_data['email']}.",
-            
-            f"El {self.get_synonym('adquirente')} {pii_data['name']} con identificación {pii_data['id']} {self.get_synonym('fija domicilio')} en {pii_data['address']}.",
-            
-            f"{pii_data['name']}, {self.get_synonym('portador')} de RUT {pii_data['id']}, {self.get_synonym('situado')} en {pii_data['address']}, ciudad {pii_data['city']}.",
-            
-            f"El {self.get_synonym('suscriptor')} {pii_data['name']}, RUT {pii_data['id']}, mantiene {self.get_synonym('ubicación')} en {pii_data['address']}.",
-            
-            f"{self.get_synonym('Solicitante')}: {pii_data['name']}, identificación: {pii_data['id']}, {self.get_synonym('lugar')}: {pii_data['address']}, contacto: {pii_data['phone']}.",
-            
-            f"Información de {pii_data['name']} ({pii_data['id']}), {self.get_synonym('establecido')} en {pii_data['address']}, {pii_data['city']}.",
-            
-            f"{pii_data['name']} con {self.get_synonym('cédula')} {pii_data['id']}, {self.get_synonym('permanece')} en {pii_data['address']}, teléfono {pii_data['phone']}.",
-        ]
-        
-        return self.random.choice(templates)
+        if self._medium_skeletons:
+            return self._render(self.random.choice(self._medium_skeletons), pii_data)
+        choice = self.random.choice
+        return choice(self._medium_renderers)(pii_data, self._rotate if self._palette_size else choice)
     
     def generate_varied_sentence(self, country: str, pii_data: Dict, 
                                  length: SentenceLength = None,
@@ -330,28 +622,21 @@ class AdvancedSentenceGenerator:
         """
         # Random selection if not specified
         if length is None:
-            length = self.random.choice([SentenceLength.MEDIUM, SentenceLength.LONG, 
-                                        SentenceLength.EXTRA_LONG])
+            length = self.random.choice(_RANDOM_LENGTHS)
         
         if complexity is None:
-            complexity = self.random.choice([SentenceComplexity.COMPOUND, 
-                                            SentenceComplexity.COMPLEX,
-                                            SentenceComplexity.COMPOUND_COMPLEX])
-        
-        # Generate based on length
-        if length == SentenceLength.LONG or length == SentenceLength.EXTRA_LONG:
-            if country == "chile":
-                return self.generate_long_sentence_chile(pii_data)
-            # Add other countries here
-        else:  # MEDIUM or SHORT
-            if country == "chile":
-                return self.generate_medium_sentence_chile(pii_data)
+            complexity = self.random.choice(_RANDOM_COMPLEXITIES)
+        
+        # Generate based on country and length
+        generators = self._generators.get(country)
+        if generators is not None:
+            return generators[length](pii_data)
         
         # Fallback
-        return f"Cliente {pii_data['name']} con ID {pii_data['id']} reside en {pii_data['address']}."
+        return _FALLBACK_TPL.format_map(pii_data)
     
     def generate_batch_varied_sentences(self, country: str, pii_data_list: List[Dict],
-                                       variety_score: float = 0.8) -> List[str]:
+                                       variety_score: float = 0.8, workers: Optional[int] = 1) -> List[str]:
         """
         Generate a batch of sentences with maximum variety.
         
@@ -359,46 +644,187 @@ class AdvancedSentenceGenerator:
             country (str): Country code
             pii_data_list (List[Dict]): List of PII data dictionaries
             variety_score (float): Target variety score (0.0-1.0), higher = more variety
+            workers (int): Worker processes for large batches (None: all CPU
+                cores, default 1: generate in this process)
             
         Returns:
             List[str]: List of generated sentences with high variety
         """
+        return list(self.iter_batch_varied_sentences(country, pii_data_list, variety_score, workers))
+    
+    def iter_batch_varied_sentences(self, country: str, pii_data_list: List[Dict],
+                                    variety_score: float = 0.8, workers: Optional[int] = 1) -> Iterator[str]:
+        """
+        Generate a batch of sentences lazily, one chunk at a time.
+        
+        Yields the same sentences as generate_batch_varied_sentences without
+        holding the whole batch in memory. Chunk seeds are drawn when this is
+        called, so the sentences do not depend on when they are consumed.
+        
+        Args:
+            country (str): Country code
+            pii_data_list (List[Dict]): List of PII data dictionaries
+            variety_score (float): Target variety score (0.0-1.0), higher = more variety
+            workers (int): Worker processes for large batches (None: all CPU
+                cores, default 1: generate in this process)
+            
+        Returns:
+            Iterator[str]: Generated sentences, in pii_data_list order
+        """
+        # Each chunk gets its own seed from self.random, so the result is the
+        # same whether chunks run here or in a process pool
+        tasks = [
+            (self.random.getrandbits(64), country, pii_data_list[i:i + SENTENCES_PER_TASK], variety_score)
+            for i in range(0, len(pii_data_list), SENTENCES_PER_TASK)
+        ]
+        
+        workers = workers or os.cpu_count() or 1
+        if workers > 1 and len(pii_data_list) >= PARALLEL_MIN_SENTENCES:
+            return self._iter_pool_chunks(tasks, workers)
+        return chain.from_iterable(self._generate_chunk(*task) for task in tasks)
+    
+    def _iter_pool_chunks(self, tasks: List[Tuple[int, str, List[Dict], float]], workers: int) -> Iterator[str]:
+        """
+        Generate chunks in a process pool, yielding their sentences in task order.
+        
+        Args:
+            tasks: (seed, country, pii_data_list, variety_score) per chunk
+            workers (int): Worker processes
+            
+        Returns:
+            Iterator[str]: Generated sentences
+        """
+        with ProcessPoolExecutor(workers, initializer=_set_worker_generator, initargs=(self,)) as pool:
+            # map keeps task order, so the batch stays reproducible
+            for chunk in pool.map(_generate_batch_chunk, tasks):
+                yield from chunk
+    
+    def _generate_chunk(self, seed: int, country: str, pii_data_list: List[Dict],
+                        variety_score: float) -> List[str]:
+        """
+        Generate one chunk of a batch from its own seed.
+        
+        Args:
+            seed (int): Seed for this chunk's draws
+            country (str): Country code
+            pii_data_list (List[Dict]): PII data of the chunk
+            variety_score (float): Target variety score (0.0-1.0)
+            
+        Returns:
+            List[str]: Generated sentences
+        """
+        master_random = self.random
+        self.random = random.Random(seed)
+        try:
+            return self._generate_batch(country, pii_data_list, variety_score)
+        finally:
+            self.random = master_random
+    
+    def _generate_batch(self, country: str, pii_data_list: List[Dict], variety_score: float) -> List[str]:
+        """
+        Generate sentences for a list of PII data, drawing from self.random.
+        
+        Args:
+            country (str): Country code
+            pii_data_list (List[Dict]): List of PII data dictionaries
+            variety_score (float): Target variety score (0.0-1.0)
+            
+        Returns:
+            List[str]: Generated sentences
+        """
         sentences = []
         
-        # Distribute lengths based on variety score
-        length_distribution = {
-            SentenceLength.SHORT: int(len(pii_data_list) * (1 - variety_score) * 0.2),
-            SentenceLength.MEDIUM: int(len(pii_data_list) * 0.4),
-            SentenceLength.LONG: int(len(pii_data_list) * variety_score * 0.5),
-            SentenceLength.EXTRA_LONG: int(len(pii_data_list) * variety_score * 0.3),
-        }
+        # Distribute lengths based on variety score, in one weighted draw
+        # (weights in _ALL_LENGTHS order: SHORT, MEDIUM, LONG, EXTRA_LONG)
+        weights = (
+            max(0.0, (1 - variety_score) * 0.2),
+            0.4,
+            max(0.0, variety_score * 0.5),
+            max(0.0, variety_score * 0.3),
+        )
+        length_queue = self.random.choices(_ALL_LENGTHS, weights=weights, k=len(pii_data_list))
+        
+        if country != "chile":
+            for pii_data, length in zip(pii_data_list, length_queue):
+                sentence = self.generate_varied_sentence(country, pii_data, length=length)
+                sentences.append(sentence)
+            return sentences
+        
+        # Preflight: pick every template first, then draw all words each
+        # synonym/connector slot needs with one vectorized draw per slot. The
+        # NumPy generator is seeded from self.random so batches stay
+        # reproducible whenever self.random is seeded
+        rng = np.random.default_rng(self.random.getrandbits(64))
+        is_long = [length >= SentenceLength.LONG for length in length_queue]
+        n_long = sum(is_long)
         
-        length_queue = []
-        for length, count in length_distribution.items():
-            length_queue.extend([length] * count)
+        # Skeletons, when enabled, have no slots left and need no words
+        long_templates = self._long_skeletons or self._LONG_TEMPLATES_CL
+        medium_templates = self._medium_skeletons or self._MEDIUM_TEMPLATES_CL
+        long_picks = rng.integers(0, len(long_templates), size=n_long)
+        medium_picks = rng.integers(0, len(medium_templates), size=len(is_long) - n_long)
         
-        # Fill remaining
-        while len(length_queue) < len(pii_data_list):
-            length_queue.append(self.random.choice(list(SentenceLength)))
+        needed = Counter()
+        for templates, picks in ((long_templates, long_picks), (medium_templates, medium_picks)):
+            for index, count in enumerate(np.bincount(picks, minlength=len(templates)).tolist()):
+                if count:
+                    for _, slot in templates[index].slots:
+                        needed[slot] += count
         
-        self.random.shuffle(length_queue)
+        words = {}
+        for slot, count in needed.items():
+            pool = self._slot_pool(*slot)
+            if pool:
+                pool_array = np.array(pool, dtype=object)
+                words[slot] = iter(pool_array[rng.integers(0, len(pool), size=count)].tolist())
+            else:
+                words[slot] = repeat(slot[1] if slot[0] == "syn" else "")
         
-        for pii_data, length in zip(pii_data_list, length_queue):
-            sentence = self.generate_varied_sentence(country, pii_data, length=length)
-            sentences.append(sentence)
+        long_picks, medium_picks = iter(long_picks.tolist()), iter(medium_picks.tolist())
+        templates = (
+            long_templates[next(long_picks)] if long else medium_templates[next(medium_picks)]
+            for long in is_long
+        )
+        sentences.extend(_assemble_batch(templates, pii_data_list, words))
         
         return sentences
 
 
-def create_advanced_generator(language: str = "es") -> AdvancedSentenceGenerator:
+# Sentences generated per seeded chunk; fixed so a batch does not depend on
+# the number of worker processes
+SENTENCES_PER_TASK = 5000
+
+# Below this many sentences the process pool start-up costs more than it saves
+PARALLEL_MIN_SENTENCES = 50000
+
+# Generator used by pool worker processes, set by the pool initializer
+_WORKER_GENERATOR: Optional[AdvancedSentenceGenerator] = None
+
+
+def _set_worker_generator(generator: AdvancedSentenceGenerator) -> None:
+    """Install the generator a worker process draws chunks with (pool initializer)"""
+    global _WORKER_GENERATOR
+    _WORKER_GENERATOR = generator
+
+
+def _generate_batch_chunk(task: Tuple[int, str, List[Dict], float]) -> List[str]:
+    """Generate one seeded chunk of a batch (worker entry point)"""
+    return _WORKER_GENERATOR._generate_chunk(*task)
+
+
+def create_advanced_generator(language: str = "es", skeletons_per_template: int = 0,
+                              synonym_palette: int = 0, seed: Optional[int] = None) -> AdvancedSentenceGenerator:
     """
     Factory function to create an advanced sentence generator.
     
     Args:
         language (str): Language code ("es" or "pt")
+        skeletons_per_template (int): Pre-rendered variants per template (0 disables)
+        synonym_palette (int): Pre-drawn words per synonym/connector pool (0 disables)
+        seed (int): Seed for the generator's random draws (None: unseeded)
         
     Returns:
         AdvancedSentenceGenerator: Configured generator instance
     """
-    return AdvancedSentenceGenerator(language=language)
-
+    return AdvancedSentenceGenerator(language=language, skeletons_per_template=skeletons_per_template,
+                                     synonym_palette=synonym_palette, seed=seed)
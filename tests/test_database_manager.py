@@ -0,0 +1,80 @@
+"""
+Test Database Manager
+=====================
+
+This module tests the SQLite database manager used to track generated data.
+
+Tests include:
+- Bulk document storage with entity statistics
+- Bulk entity storage
+- Unknown reference values in bulk rows
+
+Author: Andrés Vera Figueroa
+Date: October 2024
+Purpose: Validate bulk storage matches per-row storage
+"""
+
+import pytest
+from pathlib import Path
+
+# Import the database manager
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from database.database_manager import DatabaseManager
+
+
+@pytest.fixture
+def db_manager(tmp_path) -> DatabaseManager:
+    """Database manager on a fresh database file."""
+    return DatabaseManager(str(tmp_path / 'test.db'))
+
+
+def _document_row(document_id: str, total: int = 4, successful: int = 3):
+    """Bulk document row in bulk_store_documents order."""
+    return (document_id, 'CL', 'pii_document', 'light', 'Texto original', 'Texto corrupto',
+            'template_1', 'create-dataset', total, successful, total - successful)
+
+
+class TestBulkStorage:
+    """Bulk inserts must store the same rows as one-by-one inserts."""
+
+    def test_bulk_documents_return_ids_in_order(self, db_manager):
+        """Returned IDs point at the stored rows, in row order."""
+        db_manager.store_document('single', 'CL', 'pii_document', 'light', 'Texto')
+        doc_db_ids = db_manager.bulk_store_documents(
+            [_document_row('doc_0'), _document_row('doc_1', 0, 0), _document_row('doc_2')])
+
+        with db_manager.get_connection() as conn:
+            rows = [conn.execute("SELECT document_id, success_rate FROM generated_documents WHERE id = ?",
+                                 (doc_db_id,)).fetchone() for doc_db_id in doc_db_ids]
+
+        assert [tuple(row) for row in rows] == [('doc_0', 75.0), ('doc_1', 0.0), ('doc_2', 75.0)]
+
+    def test_bulk_entities_match_single_inserts(self, db_manager):
+        """Entities stored in bulk equal entities stored one by one."""
+        single_id, bulk_id = db_manager.bulk_store_documents([_document_row('single'), _document_row('bulk')])
+        entities = [('CUSTOMER_NAME', 'Ana Soto', 'Ana S0to', 0, 8, True, 0.9),
+                    ('ID_NUMBER', '12.345.678-9', '12.345.678-9', 12, 24, True, 1.0)]
+        for entity in entities:
+            db_manager.store_entity(single_id, *entity)
+        stored = db_manager.bulk_store_entities([(bulk_id,) + entity for entity in entities])
+
+        query = """
+            SELECT entity_type_id, original_text, corrupted_text, start_pos, end_pos,
+                   is_preserved, confidence
+            FROM document_entities WHERE document_id = ? ORDER BY id
+        """
+        with db_manager.get_connection() as conn:
+            single_rows = [tuple(row) for row in conn.execute(query, (single_id,))]
+            bulk_rows = [tuple(row) for row in conn.execute(query, (bulk_id,))]
+
+        assert stored == 2
+        assert bulk_rows == single_rows
+
+    def test_unknown_reference_raises(self, db_manager):
+        """Unknown countries and entity types are rejected before inserting."""
+        with pytest.raises(ValueError, match='Unknown country code: XX'):
+            db_manager.bulk_store_documents([('doc_x', 'XX') + _document_row('doc_x')[2:]])
+        with pytest.raises(ValueError, match='Unknown entity type: NOPE'):
+            db_manager.bulk_store_entities([(1, 'NOPE', 'a', 'a', 0, 1, True, 1.0)])
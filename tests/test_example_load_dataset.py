@@ -0,0 +1,121 @@
+"""
+Test Dataset Loading Example
+============================
+
+This module tests the loaders in examples/example_load_dataset.py.
+
+Tests include:
+- JSONL loading across read chunk boundaries
+- On-disk cache hits and invalidation of cached loaders
+- Cache location and permissions
+- Column-wise loading of large label vocabularies
+
+Author: Andrés Vera Figueroa
+Date: October 2024
+Purpose: Validate cached dataset loaders return the file's current contents
+"""
+
+import json
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+# The examples directory is not a package
+import sys
+sys.path.append(str(Path(__file__).parent.parent / 'examples'))
+
+import example_load_dataset as loader
+
+
+def _write_jsonl(path: Path, samples):
+    """Write samples as JSONL."""
+    path.write_text(''.join(json.dumps(sample) + '\n' for sample in samples), encoding='utf-8')
+
+
+def _sample(i: int):
+    """Sample with one NAME entity."""
+    return {'text': f'Hola Ana {i}', 'language': 'es',
+            'entities': [{'start': 5, 'end': 8, 'label': 'NAME', 'text': 'Ana'}]}
+
+
+class TestLoaders:
+    """Loaders must return the samples currently on disk."""
+
+    def test_jsonl_across_chunks(self, tmp_path, monkeypatch):
+        """Lines split across read chunks are joined back together."""
+        monkeypatch.setattr(loader, 'JSONL_CHUNK_SIZE', 7)
+        samples = [_sample(i) for i in range(20)]
+        _write_jsonl(tmp_path / 'train.jsonl', samples)
+
+        assert list(loader.iter_jsonl(str(tmp_path / 'train.jsonl'))) == samples
+
+    def test_cache_hit_and_invalidation(self, tmp_path, monkeypatch):
+        """A cached load matches a fresh one and is refreshed when the file changes."""
+        monkeypatch.setattr(loader, 'CACHE_DIR', str(tmp_path / 'cache'))
+        path = tmp_path / 'data' / 'train.jsonl'
+        path.parent.mkdir()
+        _write_jsonl(path, [_sample(i) for i in range(3)])
+
+        first = loader.load_jsonl(str(path))
+        assert loader.load_jsonl(str(path)) == first == loader.load_jsonl(str(path), use_cache=False)
+
+        _write_jsonl(path, [_sample(i) for i in range(5)])
+        file_stat = path.stat()
+        os.utime(path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000_000))
+
+        assert loader.load_jsonl(str(path)) == [_sample(i) for i in range(5)]
+
+    def test_cache_is_private_and_outside_the_dataset(self, tmp_path, monkeypatch):
+        """Entries go to a user-only directory, named by key hash, never beside the data."""
+        cache_dir = tmp_path / 'cache'
+        monkeypatch.setattr(loader, 'CACHE_DIR', str(cache_dir))
+        path = tmp_path / 'data' / 'train.jsonl'
+        path.parent.mkdir()
+        _write_jsonl(path, [_sample(0)])
+
+        loader.load_jsonl(str(path))
+
+        assert os.listdir(path.parent) == ['train.jsonl']
+        assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+        (entry,) = os.listdir(cache_dir)
+        assert len(entry) == len('0' * 64 + '.pkl') and entry.endswith('.pkl')
+
+    def test_shared_cache_directory_is_not_used(self, tmp_path, monkeypatch):
+        """A cache directory others can write to is neither read nor written."""
+        cache_dir = tmp_path / 'cache'
+        cache_dir.mkdir()
+        cache_dir.chmod(0o777)
+        monkeypatch.setattr(loader, 'CACHE_DIR', str(cache_dir))
+        path = tmp_path / 'train.jsonl'
+        _write_jsonl(path, [_sample(0)])
+
+        assert loader.load_jsonl(str(path)) == [_sample(0)]
+        assert os.listdir(cache_dir) == []
+
+
+class TestColumnarLoader:
+    """The column-wise loader must encode every label the file uses."""
+
+    def test_more_than_256_labels(self, tmp_path):
+        """Vocabularies past the uint8 range load without overflowing."""
+        samples = [{'text': 'Ana', 'language': f'l{i}',
+                    'entities': [{'start': 0, 'end': 3, 'label': f'LABEL_{i}', 'text': 'Ana'}]}
+                   for i in range(300)]
+        _write_jsonl(tmp_path / 'train.jsonl', samples)
+
+        dataset = loader.load_jsonl_soa(str(tmp_path / 'train.jsonl'))
+
+        assert [dataset.labels[i] for i in dataset.entity_label_ids] == [f'LABEL_{i}' for i in range(300)]
+        assert [dataset.languages[i] for i in dataset.language_ids] == [f'l{i}' for i in range(300)]
+
+    def test_too_many_labels_raises(self, tmp_path):
+        """More labels than the codes can hold is a clear error, not an OverflowError."""
+        samples = [{'text': 'Ana', 'language': 'es',
+                    'entities': [{'start': 0, 'end': 3, 'label': f'L{i}', 'text': 'Ana'}
+                                 for i in range(loader.MAX_CODES + 1)]}]
+        _write_jsonl(tmp_path / 'train.jsonl', samples)
+
+        with pytest.raises(ValueError, match='distinct languages or entity labels'):
+            loader.load_jsonl_soa(str(tmp_path / 'train.jsonl'))
@@ -127,7 +127,20 @@ class TestSpacyFormatConverter:
                 
             except ImportError:
                 pytest.skip("spaCy not available for loading test")
-    
+
+    def test_convert_and_save_many(self, spacy_converter, sample_documents):
+        """Test that each split is written to the same DocBin as a separate save."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            splits = {'train': sample_documents[:2], 'dev': sample_documents[2:]}
+            saved_files = spacy_converter.convert_and_save_many(splits, temp_dir)
+
+            assert set(saved_files) == {'train', 'dev'}
+            for key, documents in splits.items():
+                assert saved_files[key] == str(Path(temp_dir) / f'{key}.spacy')
+                expected_path = Path(temp_dir) / f'expected_{key}.spacy'
+                assert spacy_converter.convert_and_save(documents, str(expected_path))
+                assert Path(saved_files[key]).read_bytes() == expected_path.read_bytes()
+
     def test_overlapping_entities_resolution(self, spacy_converter):
         """Test handling of overlapping entities."""
         doc_data = {
@@ -264,6 +277,33 @@ class TestTransformersFormatConverter:
         blank_lines = [i for i, line in enumerate(conll_lines) if line == ""]
         assert len(blank_lines) >= len(sample_documents) - 1
     
+    def test_parallel_conversion_matches_serial(self, sample_documents):
+        """Test that pooled conversion preserves document order and output."""
+        from dataset_composer.format_converters import PARALLEL_THRESHOLD
+        
+        documents = sample_documents * (PARALLEL_THRESHOLD // len(sample_documents) + 1)
+        parallel_lines = TransformersFormatConverter(max_workers=2).convert_documents_to_conll(documents)
+        serial_lines = TransformersFormatConverter(max_workers=1).convert_documents_to_conll(documents)
+        
+        assert parallel_lines == serial_lines
+    
+    def test_unavailable_pool_falls_back_to_serial(self, sample_documents, monkeypatch):
+        """Test that conversion still succeeds when the process pool cannot start."""
+        from dataset_composer import format_converters
+        
+        def unavailable_pool(*args, **kwargs):
+            raise OSError("process pool unavailable")
+        
+        documents = sample_documents * (format_converters.PARALLEL_THRESHOLD // len(sample_documents) + 1)
+        serial_lines = TransformersFormatConverter(max_workers=1).convert_documents_to_conll(documents)
+        monkeypatch.setattr(format_converters, 'ProcessPoolExecutor', unavailable_pool)
+        converter = TransformersFormatConverter(max_workers=2)
+        
+        assert converter.convert_documents_to_conll(documents) == serial_lines
+        with tempfile.TemporaryDirectory() as temp_dir:
+            saved_files = converter.convert_and_save_many({'train': documents}, temp_dir)
+            assert Path(saved_files['train']).read_text(encoding='utf-8') == '\n'.join(serial_lines) + '\n'
+    
     def test_save_and_load_conll(self, transformers_converter, sample_documents):
         """Test saving and loading CONLL files."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -288,6 +328,33 @@ class TestTransformersFormatConverter:
                     parts = line.split('\t')
                     assert len(parts) == 2
     
+    def test_streaming_save_matches_save_conll(self, transformers_converter, sample_documents):
+        """Test that streaming export writes the same bytes as save_conll."""
+        documents = sample_documents + [{'document_id': 'empty', 'text': '', 'entities': []}]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            streamed_path = Path(temp_dir) / 'streamed.conll'
+            saved_path = Path(temp_dir) / 'saved.conll'
+            
+            assert transformers_converter.convert_and_save_streaming(documents, str(streamed_path))
+            conll_lines = transformers_converter.convert_documents_to_conll(documents)
+            assert transformers_converter.save_conll(conll_lines, str(saved_path))
+            
+            assert streamed_path.read_bytes() == saved_path.read_bytes()
+    
+    def test_convert_and_save_many(self, transformers_converter, sample_documents):
+        """Test that each split is written to its own CONLL file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            splits = {'train': sample_documents[:1], 'dev': sample_documents[1:]}
+            saved_files = transformers_converter.convert_and_save_many(splits, temp_dir)
+            
+            assert set(saved_files) == {'train', 'dev'}
+            for key, documents in splits.items():
+                assert saved_files[key] == str(Path(temp_dir) / f'{key}.conll')
+                expected_path = Path(temp_dir) / f'expected_{key}.conll'
+                transformers_converter.convert_and_save(documents, str(expected_path))
+                assert Path(saved_files[key]).read_bytes() == expected_path.read_bytes()
+    
     def test_validate_conll_format(self, transformers_converter):
         """Test CONLL format validation."""
         # Valid CONLL lines
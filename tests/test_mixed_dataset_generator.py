@@ -0,0 +1,104 @@
+"""
+Test Mixed Dataset Generator
+============================
+
+This module tests the balanced mixed dataset generator.
+
+Tests include:
+- Independence of documents copied from a batch template
+- Negative example fallback documents
+- Process pool generation of PII documents
+
+Author: Andrés Vera Figueroa
+Date: October 2024
+Purpose: Validate mixed dataset composition and document generation
+"""
+
+import pytest
+from pathlib import Path
+
+# Import the generator
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from dataset_composer import mixed_dataset_generator
+from dataset_composer.mixed_dataset_generator import DatasetComposition, MixedDatasetGenerator
+
+
+@pytest.fixture
+def generator() -> MixedDatasetGenerator:
+    """Generator without external components, seeded and in-process."""
+    return MixedDatasetGenerator(seed=42, max_workers=1)
+
+
+@pytest.fixture
+def composition() -> DatasetComposition:
+    """Default dataset composition."""
+    return DatasetComposition()
+
+
+class TestBatchDocuments:
+    """Documents copied from one template must not share mutable state."""
+
+    def test_pii_batch_documents_are_independent(self, generator, composition):
+        """Mutating one PII document leaves the rest of the batch untouched."""
+        documents = generator._generate_pii_batch(3, 'chile', 'light', composition)
+        documents[0]['entities'].append({'start': 0, 'end': 6, 'label': 'TEST'})
+        documents[0]['metadata']['entity_types'].append('EXTRA')
+        documents[0]['metadata']['generation_method'] = 'edited'
+
+        for document in documents[1:]:
+            assert document['entities'] == []
+            assert 'EXTRA' not in document['metadata']['entity_types']
+            assert document['metadata']['generation_method'] == 'pii_generator'
+        assert 'EXTRA' not in composition.entity_type_weights
+
+    def test_negative_fallback_documents_are_independent(self, generator):
+        """Mutating one fallback negative document leaves the rest untouched."""
+        documents = generator._generate_negative_batch(3, 'invoice', 'none')
+        documents[0]['entities'].append({'start': 0, 'end': 6, 'label': 'TEST'})
+        documents[0]['metadata']['doc_type'] = 'edited'
+
+        for document in documents[1:]:
+            assert document['entities'] == []
+            assert document['metadata']['doc_type'] == 'invoice'
+
+
+class TestParallelGeneration:
+    """The process pool is opt-in and must not change the documents."""
+
+    def test_pool_is_opt_in(self):
+        """By default PII documents are generated in this process."""
+        assert MixedDatasetGenerator().max_workers == 1
+
+    def test_pool_output_matches_serial(self, composition, monkeypatch):
+        """PII documents generated in a pool equal the in-process ones."""
+        monkeypatch.setattr(mixed_dataset_generator, 'PARALLEL_THRESHOLD', 0)
+        serial = MixedDatasetGenerator(seed=7, max_workers=1)._generate_pii_documents(500, composition)
+        pooled = MixedDatasetGenerator(seed=7, max_workers=2)._generate_pii_documents(500, composition)
+
+        assert len(serial) == 500
+        assert pooled == serial
+
+
+class TestStatistics:
+    """Dataset statistics are plain, JSON-ready dictionaries."""
+
+    def test_distributions_are_plain_dicts(self, generator, composition):
+        """Distributions are dicts, so a missing key raises KeyError."""
+        documents = [
+            {'country': 'chile', 'corruption_level': 'light', 'document_type': 'pii_document',
+             'has_pii': True, 'text': 'Ana Soto', 'entities': [{'label': 'CUSTOMER_NAME'}]},
+            {'country': 'mexico', 'corruption_level': 'none', 'document_type': 'invoice',
+             'has_pii': False, 'text': 'Factura', 'entities': []},
+        ]
+        stats = generator._calculate_dataset_statistics(documents, composition)
+
+        assert stats['country_distribution'] == {'chile': 1, 'mexico': 1}
+        assert stats['entity_statistics']['entity_type_distribution'] == {'CUSTOMER_NAME': 1}
+        for distribution in (stats['country_distribution'], stats['corruption_distribution'],
+                             stats['document_type_distribution'],
+                             stats['entity_statistics']['entity_type_distribution']):
+            assert type(distribution) is dict
+        with pytest.raises(KeyError):
+            stats['country_distribution']['brazil']
@@ -0,0 +1,101 @@
+"""
+Test NER Dataset Generator (ADDRESS / SEX)
+==========================================
+
+This module tests the example NER dataset generator in
+examples/generate_ner_dataset_address_sex.py.
+
+Tests include:
+- Entity offsets and ordering of rendered templates
+- BIO tagging of generated samples and partially covered tokens
+- Reproducible chunked generation, in process and in a process pool
+- Train/validation split sizes
+
+Author: Andrés Vera Figueroa
+Date: October 2024
+Purpose: Validate the synthetic ADDRESS/SEX NER samples
+"""
+
+import pytest
+import random
+from pathlib import Path
+
+from faker import Faker
+
+# The examples directory is not a package
+import sys
+sys.path.append(str(Path(__file__).parent.parent / 'examples'))
+
+import generate_ner_dataset_address_sex as ner
+
+
+class TestTemplateRendering:
+    """Compiled templates must yield ordered, correctly placed entities."""
+
+    @pytest.mark.parametrize('template', ner.TEMPLATES_ES + ner.TEMPLATES_EN + ner.TEMPLATES_PT)
+    def test_entities_ordered_and_aligned(self, template):
+        """Entities come out in position order and match the text they label."""
+        text, entities = ner._render(ner._COMPILED_TEMPLATES[template],
+                                     'Ana María Soto', 'femenino', 'Calle Falsa 123, Santiago')
+
+        assert text == template.format(name='Ana María Soto', sex='femenino',
+                                       address='Calle Falsa 123, Santiago')
+        assert all(left['end'] <= right['start'] for left, right in zip(entities, entities[1:]))
+        for entity in entities:
+            assert text[entity['start']:entity['end']] == entity['text']
+
+    def test_bio_tags_match_entities(self):
+        """Each entity starts with a B- tag followed by I- tags."""
+        sample = ner.generate_sample('es', ner.TEMPLATES_ES[0], 'masculino',
+                                     'Juan Pérez', 'Av. Providencia 123')
+        tokens, tags = ner.convert_to_bio(sample['text'], sample['entities'])
+
+        assert len(tokens) == len(tags)
+        assert tags.count('B-NAME') == tags.count('B-SEX') == tags.count('B-ADDRESS') == 1
+        assert tokens[tags.index('B-NAME')] == 'Juan'
+
+    def test_bio_tags_partially_covered_tokens(self):
+        """Tokens overlapping an entity only in part are tagged too."""
+        text = 'Vive en Santiago Centro hoy'
+        tokens, tags = ner.convert_to_bio(text, [{'start': 10, 'end': 18, 'label': 'ADDRESS'}])
+
+        assert tokens == ['Vive', 'en', 'Santiago', 'Centro', 'hoy']
+        assert tags == ['O', 'O', 'B-ADDRESS', 'I-ADDRESS', 'O']
+
+
+class TestChunkedGeneration:
+    """Seeded chunks must not depend on where or how they are generated."""
+
+    def test_chunk_leaves_global_random_untouched(self):
+        """Generating a chunk in process does not reseed the caller's RNG."""
+        random.seed(7)
+        expected = random.random()
+        random.seed(7)
+        ner._generate_chunk((123, ['es', 'en', 'pt']))
+
+        assert random.random() == expected
+
+    def test_chunk_is_reproducible(self):
+        """The same seed yields the same samples."""
+        task = (99, ['es', 'pt', 'en', 'es'])
+
+        assert ner._generate_chunk(task) == ner._generate_chunk(task)
+
+    def test_pool_output_matches_serial(self, tmp_path, monkeypatch, capsys):
+        """A process pool writes exactly the same files as in-process generation."""
+        monkeypatch.setattr(ner, 'PARALLEL_MIN_SAMPLES', 0)
+        for workers in (1, 2):
+            random.seed(42)
+            Faker.seed(42)
+            ner.generate_dataset(num_samples=450, output_dir=str(tmp_path / f'w{workers}'), workers=workers)
+
+        for name in ('train.jsonl', 'val.jsonl', 'train.conll', 'val.csv', 'dataset_stats.json'):
+            assert (tmp_path / 'w1' / name).read_bytes() == (tmp_path / 'w2' / name).read_bytes()
+
+    def test_split_sizes(self, tmp_path, capsys):
+        """Train and validation files hold exactly the requested split."""
+        ner.generate_dataset(num_samples=250, train_ratio=0.8, output_dir=str(tmp_path), workers=1)
+
+        for name, expected in (('train', 200), ('val', 50)):
+            with open(tmp_path / f'{name}.jsonl', encoding='utf-8') as f:
+                assert sum(1 for _ in f) == expected